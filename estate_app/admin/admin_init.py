@@ -1,7 +1,7 @@
+import asyncio
+
 import redis.asyncio as redis
-from fastapi_admin.providers.login import UsernamePasswordProvider
-from .admin_models import AdminUser
-from .admin_resources import UserResource
+from fastapi import FastAPI
 from core.get_db import Base, async_engine
 from core.settings import settings
 
@@ -19,6 +19,14 @@ class AdminManager:
 
             self.admin_app = admin_app
 
+    async def mount(self, app: FastAPI):
+        """Lazy import and mount both admin panels at startup."""
+        from admin_piccolo_folder.admin_app import AdminApp
+
+        await self.load_fastapi_admin()
+        app.mount("/fastapi/admin", self.admin_app)  # FastApi_Admin with Tortoise
+        app.mount("/admin", AdminApp)  # FastApi_Admin with SQLAlchemy
+
     async def connect_redis(self):
         """Connect to Redis Cloud."""
         self.redis_client = redis.from_url(
@@ -37,6 +45,11 @@ class AdminManager:
 
     async def configure_admin(self):
         """Configure FastAPI-Admin with redis, login, and resources."""
+        from fastapi_admin.providers.login import UsernamePasswordProvider
+
+        from .admin_models import AdminUser
+        from .admin_resources import UserResource
+
         await self.load_fastapi_admin()
 
         await self.admin_app.configure(
@@ -48,8 +61,7 @@ class AdminManager:
 
     async def setup(self):
         """Full admin setup."""
-        await self.connect_redis()
-        await self.init_db()
+        await asyncio.gather(self.connect_redis(), self.init_db())
         await self.configure_admin()
 
 
@@ -14,7 +14,6 @@ class UserTable(Table):
     username = Varchar(unique=True)
     email = Varchar(unique=True)
     phone_number = Varchar(null=True)
-    role = Varchar()
     is_active = Boolean(default=True)
     is_verified = Boolean(default=False)
     created_at = Timestamptz()
@@ -1,10 +1,12 @@
 # create_piccolo_admin.py
 import asyncio
+from bcrypt import gensalt, hashpw
+from core.settings import settings
 from .admin_user import AdminUser
-from passlib.hash import bcrypt   
 
 async def run():
-    hashed = bcrypt.hash("admin123")
+    salt = gensalt(rounds=settings.ADMIN_BCRYPT_ROUNDS)
+    hashed = hashpw("admin123".encode("utf-8"), salt).decode("utf-8")
     await AdminUser.create(username="admin", password=hashed, is_superuser=True)
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
 from logging.config import fileConfig
-from sqlalchemy import pool, text
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 from alembic import context
 
@@ -90,14 +90,16 @@ async def run_migrations_online():
     connectable = create_async_engine(
         DATABASE_URL,
         echo=False,
-        poolclass=pool.NullPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
     )
 
-    async with connectable.begin() as conn:
-        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis;"))
+    async with connectable.connect() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS postgis;"))
+        await connection.commit()
         print("PostGIS extension enabled (or already exists).")
 
-    async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
 
     await connectable.dispose()
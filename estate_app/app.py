@@ -1,15 +1,14 @@
+import logging
+
+from core.log_queue import setup_queue_logging
 from core.setup_gdal import setup_gdal
 
+setup_queue_logging(logging.INFO)
 setup_gdal()  # Only use it in development
-# from core.redis_patch import setup_redis
 
-# setup_redis()
-
-import logging
 from pathlib import Path
 
 import uvicorn
-from admin_piccolo_folder.admin_app import AdminApp
 from core.auto_logout_middleware import AutoLogoutMiddleware
 from core.catch_error_middleware import ErrorHandlerMiddleware
 from core.csrf_middleware import AutoRefreshAccessTokenMiddleware
@@ -21,8 +20,7 @@ from core.throttling import rate_limiter_manager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from fastapi_admin.app import app as admin_app
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from realtime.chat_routes import router as sales_chat_router
 from routes.auth_routes import router as user_router
 from routes.cloudinary_routes import router as cloudinary_router
@@ -50,18 +48,17 @@ from routes.letters_routes import router as letter_router
 app = FastAPI()
 
 
-logging.basicConfig(level=logging.INFO)
 app = FastAPI(
     lifespan=lifespan,
     title=settings.PROJECT_NAME,
     exception_handlers={429: rate_limiter_manager.limit_exceeded_handler},
+    default_response_class=ORJSONResponse,
     version="2.0.0",
 )
 
 BASE_DIR = Path(__file__).resolve().parent
+INDEX_HTML = (BASE_DIR / "templates" / "index.html").read_bytes()
 
-app.mount("/fastapi/admin", admin_app)  # FastApi_Admin with Tortoise
-app.mount("/admin", AdminApp)  # FastApi_Admin with SQLAlchemy
 app.include_router(csrf_router, prefix="/v2")
 app.include_router(user_router, prefix="/v2")
 app.include_router(bank_router, prefix="/v2")
@@ -102,8 +99,7 @@ async def health_check():
 
 @app.get("/", response_class=HTMLResponse)
 async def index():
-    with open("templates/index.html", "r", encoding="utf-8") as f:
-        return f.read()
+    return HTMLResponse(content=INDEX_HTML)
 
 
 app.add_exception_handler(
@@ -9,6 +9,22 @@ celery_app = Celery(
     "real_estate_tasks",
     broker=REDIS_URL,
     backend=REDIS_URL,
+    include=[
+        "tasks.account_name_match_tasks",
+        "tasks.expire_pending_rental_viewings",
+        "tasks.expire_pending_sales_viewings",
+        "tasks.get_bank_name_tasks",
+        "tasks.get_receipient_code_tasks",
+        "tasks.prembly_bvn_tasks",
+        "tasks.prembly_nin_tasks",
+        "tasks.process_payment_transfer_tasks",
+        "tasks.qoreid_nin_task",
+        "tasks.receipt_tasks",
+        "tasks.rent_notifications",
+        "tasks.send_letter_tasks",
+        "tasks.update_bank_codes_tasks",
+        "tasks.youverify_nin_tasks",
+    ],
 )
 
 celery_app.conf.update(
@@ -70,19 +86,4 @@ def delay(func_name: str, *args, **kwargs):
     return celery_app.send_task(func_name, args=args, kwargs=kwargs)
 
 
-import tasks.account_name_match_tasks
-import tasks.expire_pending_rental_viewings
-import tasks.expire_pending_sales_viewings
-import tasks.get_bank_name_tasks
-import tasks.get_receipient_code_tasks
-import tasks.prembly_bvn_tasks
-import tasks.prembly_nin_tasks
-import tasks.process_payment_transfer_tasks
-import tasks.qoreid_nin_task
-import tasks.receipt_tasks
-import tasks.rent_notifications
-import tasks.send_letter_tasks
-import tasks.update_bank_codes_tasks
-import tasks.youverify_nin_tasks
-
 app = celery_app
@@ -1,8 +1,14 @@
 import asyncio
+import threading
 from datetime import datetime, timezone
 
 from core.event_publish import publish_event
 
+_bg_loop = asyncio.new_event_loop()
+threading.Thread(
+    target=_bg_loop.run_forever, name="celery-events-loop", daemon=True
+).start()
+
 
 async def publish_task_event(task_name: str, status: str, result_key: str = ""):
     payload = {
@@ -12,8 +18,9 @@ async def publish_task_event(task_name: str, status: str, result_key: str = ""):
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
     try:
-        await asyncio.to_thread(
-            lambda: asyncio.run(publish_event(f"task.{task_name}", payload))
+        future = asyncio.run_coroutine_threadsafe(
+            publish_event(f"task.{task_name}", payload), _bg_loop
         )
+        await asyncio.wrap_future(future)
     except Exception as e:
         print(f"[Celery Event Error] {task_name}: {e}")
@@ -1,8 +1,12 @@
 import asyncio
+import threading
 from typing import Callable, Any
 
 
 class AsyncioBaseService:
+    _bg_loop: asyncio.AbstractEventLoop | None = None
+    _bg_lock = threading.Lock()
+
     async def run_blocking(
         self,
         func: Callable[..., Any],
@@ -12,18 +16,20 @@ class AsyncioBaseService:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(executor, func, *args)
 
+    @classmethod
+    def _get_bg_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._bg_lock:
+            if cls._bg_loop is None:
+                cls._bg_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=cls._bg_loop.run_forever,
+                    name="asyncio-bg-loop",
+                    daemon=True,
+                ).start()
+        return cls._bg_loop
+
     def run_async_event(self, coro):
-        loop = asyncio.new_event_loop()
-
-        try:
-            asyncio.set_event_loop(loop)
-            return loop.run_until_complete(coro)
-        finally:
-            try:
-                loop.run_until_complete(loop.shutdown_asyncgens())
-            finally:
-                asyncio.set_event_loop(None)
-                loop.close()
+        return asyncio.run_coroutine_threadsafe(coro, self._get_bg_loop()).result()
 
     def run_async(self, coro):
         return asyncio.run(coro)
@@ -1,63 +1,98 @@
-from datetime import datetime, timezone
+import time
 
+import jwt
 from fastapi import Request
-from fastapi.responses import JSONResponse
-from jose import ExpiredSignatureError, JWTError, jwt
-from repos.auth_repo import AuthRepo
+from fastapi.responses import ORJSONResponse, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from core.blacklist_queue import blacklist_queue
 from core.cache import cache
-from core.get_db import AsyncSessionLocal
 from core.settings import settings
 
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 AUTO_LOGOUT_SECONDS = 10 * 60
+DECODE_CACHE_SIZE = 4096
+SKIP_PREFIXES = (
+    "/health",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/static",
+    "/admin",
+    "/fastapi/admin",
+)
+
+_DECODE_CACHE: dict[str, tuple[str, int | None]] = {}
+
+
+def _build_logout_cookie_headers() -> list[tuple[bytes, bytes]]:
+    response = Response()
+    for cookie in (
+        "access_token",
+        "refresh_token",
+        "csrf_token",
+        "session",
+    ):
+        response.delete_cookie(
+            key=cookie,
+            path="/",
+            httponly=True,
+            samesite="lax",
+            secure=settings.SECURE_COOKIES,
+        )
+    return [
+        header for header in response.raw_headers if header[0] == b"set-cookie"
+    ]
+
+
+_LOGOUT_COOKIE_HEADERS = _build_logout_cookie_headers()
 
 
 class AutoLogoutMiddleware(BaseHTTPMiddleware):
 
     @classmethod
-    async def _logout_response(cls) -> JSONResponse:
-        response = JSONResponse(
+    async def _logout_response(cls) -> ORJSONResponse:
+        response = ORJSONResponse(
             {"detail": "Session expired due to inactivity"},
             status_code=401,
         )
 
-        for cookie in (
-            "access_token",
-            "refresh_token",
-            "csrf_token",
-            "session",
-        ):
-            response.delete_cookie(
-                key=cookie,
-                path="/",
-                httponly=True,
-                samesite="lax",
-                secure=settings.SECURE_COOKIES,
-            )
-
+        response.raw_headers.extend(_LOGOUT_COOKIE_HEADERS)
         return response
 
     @classmethod
     async def _decode_access_user_id(cls, token: str) -> str | None:
+        signature = token.rpartition(".")[2]
+        cached = _DECODE_CACHE.get(signature)
+        if cached is not None:
+            user_id, exp = cached
+            if exp is None or exp > time.time():
+                return user_id
+            _DECODE_CACHE.pop(signature, None)
+            return None
+
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             if payload.get("type") != "access":
                 return None
-            return payload.get("sub")
-        except (JWTError, ExpiredSignatureError):
+            user_id = payload.get("sub")
+        except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
             return None
 
+        if user_id:
+            if len(_DECODE_CACHE) >= DECODE_CACHE_SIZE:
+                _DECODE_CACHE.pop(next(iter(_DECODE_CACHE)))
+            _DECODE_CACHE[signature] = (user_id, payload.get("exp"))
+        return user_id
+
     async def _blacklist_tokens(self, access_token: str, refresh_token: str | None):
-        async with AsyncSessionLocal() as db:
-            repo = AuthRepo(db)
-            await repo.blacklist_token(access_token)
-            if refresh_token:
-                await repo.blacklist_token(refresh_token)
+        await blacklist_queue.enqueue(access_token, refresh_token)
 
     async def dispatch(self, request: Request, call_next):
+        if request.url.path.startswith(SKIP_PREFIXES):
+            return await call_next(request)
+
         access_token = request.cookies.get("access_token")
         refresh_token = request.cookies.get("refresh_token")
 
@@ -69,20 +104,12 @@ class AutoLogoutMiddleware(BaseHTTPMiddleware):
             await self._blacklist_tokens(access_token, refresh_token)
             return await self._logout_response()
 
-        redis_key = f"auth:last_activity:{user_id}"
-        now = int(datetime.now(timezone.utc).timestamp())
-
-        last_activity = await cache.get(redis_key)
+        request.state.rate_limit_id = f"user:{user_id}"
 
-        if last_activity:
-            inactivity = now - int(last_activity)
-            if inactivity > AUTO_LOGOUT_SECONDS:
-                await self._blacklist_tokens(access_token, refresh_token)
-                await cache.delete(redis_key)
-                return await self._logout_response()
+        redis_key = f"auth:last_activity:{user_id}"
+        now = int(time.time())
 
-        
-        await cache.set(
+        await cache.touch(
             redis_key,
             str(now),
             ttl=AUTO_LOGOUT_SECONDS,
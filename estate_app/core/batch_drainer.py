@@ -0,0 +1,68 @@
+import abc
+import asyncio
+from typing import Any
+
+_STOP = object()
+
+
+class BatchDrainer(abc.ABC):
+    def __init__(self, batch_size: int, linger: float = 0.0, maxsize: int = 10_000):
+        self.batch_size = batch_size
+        self.linger = linger
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+        self.worker: asyncio.Task | None = None
+
+    def start(self):
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self._drain_worker())
+
+    async def stop(self):
+        worker, self.worker = self.worker, None
+        if worker is None:
+            return
+        if not worker.done():
+            await self.queue.put(_STOP)
+            await worker
+        while not self.queue.empty():
+            items, _ = self._take_pending()
+            await self._flush(items)
+
+    def is_running(self) -> bool:
+        return (
+            self.worker is not None
+            and not self.worker.done()
+            and self.worker.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def submit(self, item):
+        if self.is_running() and not self.queue.full():
+            self.queue.put_nowait(item)
+            return
+        await self._flush([item])
+
+    def _take_pending(self) -> tuple[list, bool]:
+        items = []
+        while len(items) < self.batch_size:
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is _STOP:
+                return items, True
+            items.append(item)
+        return items, False
+
+    @abc.abstractmethod
+    async def _flush(self, items: list): ...
+
+    async def _drain_worker(self):
+        while True:
+            first = await self.queue.get()
+            if first is _STOP:
+                return
+            if self.linger:
+                await asyncio.sleep(self.linger)
+            items, stopping = self._take_pending()
+            await self._flush([first, *items])
+            if stopping:
+                return
@@ -0,0 +1,33 @@
+import logging
+
+from repos.auth_repo import AuthRepo
+
+from .batch_drainer import BatchDrainer
+from .get_db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class BlacklistQueue(BatchDrainer):
+    def __init__(self, batch_size: int = 128):
+        super().__init__(batch_size)
+
+    async def enqueue(self, access_token: str, refresh_token: str | None = None):
+        await self.submit((access_token, refresh_token))
+
+    async def _flush(self, items: list[tuple[str, str | None]]):
+        tokens = list(
+            dict.fromkeys(
+                token for pair in items for token in pair if token is not None
+            )
+        )
+        if not tokens:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                await AuthRepo(db).blacklist_tokens(tokens)
+        except Exception:
+            logger.exception("Failed to blacklist %d tokens", len(tokens))
+
+
+blacklist_queue = BlacklistQueue()
@@ -7,6 +7,18 @@ logger = logging.getLogger(__name__)
 
 
 class CircuitBreaker:
+    __slots__ = (
+        "failure_count",
+        "failure_threshold",
+        "base_recovery_time",
+        "max_recovery_time",
+        "last_failure_time",
+        "state",
+        "max_retries",
+        "retry_queue",
+        "dropped_retries",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 3,
@@ -14,6 +26,7 @@ class CircuitBreaker:
         max_recovery_time: int = 60,
         enable_retry_queue: bool = False,
         max_retries: int = 1,
+        max_queue_size: int = 1024,
     ):
         self.failure_count = 0
         self.failure_threshold = failure_threshold
@@ -23,20 +36,18 @@ class CircuitBreaker:
         self.state = "CLOSED"
         self.max_retries = max_retries
         self.retry_queue: Optional[Deque[dict]] = (
-            deque() if enable_retry_queue else None
+            deque(maxlen=max_queue_size) if enable_retry_queue else None
         )
+        self.dropped_retries = 0
 
     @property
     def current_recovery_time(self):
-        return min(
-            self.base_recovery_time
-            * (2 ** (self.failure_count - self.failure_threshold)),
-            self.max_recovery_time,
-        )
+        exponent = self.failure_count - self.failure_threshold
+        return min(self.base_recovery_time * (2**exponent), self.max_recovery_time)
 
     def _open(self):
         self.state = "OPEN"
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         logger.warning(f"Circuit opened after {self.failure_count} failures.")
 
     def _half_open(self):
@@ -48,14 +59,49 @@ class CircuitBreaker:
         self.failure_count = 0
         logger.info("Circuit closed: stable again.")
 
+    def _record_failure(self, func, args, kwargs, error: Exception):
+        self.failure_count += 1
+        logger.error(f"CircuitBreaker call failed ({self.failure_count}): {error}")
+
+        if self.failure_count >= self.failure_threshold:
+            self._open()
+
+        if self.retry_queue is not None:
+            if len(self.retry_queue) == self.retry_queue.maxlen:
+                self.dropped_retries += 1
+                logger.warning(
+                    f"Retry queue full; dropped oldest operation "
+                    f"({self.dropped_retries} dropped so far)."
+                )
+            self.retry_queue.append(
+                {
+                    "func": func,
+                    "args": args,
+                    "kwargs": kwargs,
+                    "retries": 0,
+                }
+            )
+            logger.info(f"Queued failed operation ({len(self.retry_queue)} pending).")
+
     async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
-        now = time.time()
+        state = self.state
+        if state == "CLOSED" and self.failure_count == 0:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self._record_failure(func, args, kwargs, e)
+                raise e
 
-        if self.state == "OPEN":
+            if self.retry_queue:
+                await self._flush_retry_queue()
+            return result
+
+        if state == "OPEN":
+            elapsed = time.monotonic() - self.last_failure_time
             cooldown = self.current_recovery_time
-            if now - self.last_failure_time < cooldown:
+            if elapsed < cooldown:
                 raise Exception(
-                    f"CircuitBreaker: still open, retry after {cooldown - (now - self.last_failure_time):.1f}s"
+                    f"CircuitBreaker: still open, retry after {cooldown - elapsed:.1f}s"
                 )
             else:
                 self._half_open()
@@ -70,30 +116,13 @@ class CircuitBreaker:
             return result
 
         except Exception as e:
-            self.failure_count += 1
-            logger.error(f"CircuitBreaker call failed ({self.failure_count}): {e}")
-
-            if self.failure_count >= self.failure_threshold:
-                self._open()
-
-            if self.retry_queue is not None:
-                self.retry_queue.append(
-                    {
-                        "func": func,
-                        "args": args,
-                        "kwargs": kwargs,
-                        "retries": 0,
-                    }
-                )
-                logger.info(
-                    f"Queued failed operation ({len(self.retry_queue)} pending)."
-                )
-            # -----------------------------------------
-
+            self._record_failure(func, args, kwargs, e)
             raise e
 
     async def _flush_retry_queue(self):
-        while self.retry_queue:
+        for _ in range(len(self.retry_queue)):
+            if not self.retry_queue:
+                break
             item = self.retry_queue.popleft()
             func = item["func"]
             args = item["args"]
@@ -114,9 +143,7 @@ class CircuitBreaker:
                 logger.error(f"Retry failed: {e}")
 
                 item["retries"] = retries + 1
-                self.retry_queue.appendleft(item)
-
-                break
+                self.retry_queue.append(item)
 
 
 breaker = CircuitBreaker(
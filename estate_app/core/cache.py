@@ -1,11 +1,12 @@
 import asyncio
 import base64
-import json
 import logging
-import urllib.parse
 from typing import Any, Optional
 
-import httpx
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .breaker import breaker
@@ -13,133 +14,214 @@ from .settings import settings
 
 logger = logging.getLogger(__name__)
 
+JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+_background_tasks: set[asyncio.Task] = set()
+
 
 class Cache:
     def __init__(self):
-        self.redis_url = settings.UPSTASH_REDIS_URL.rstrip("/")
-        self.redis_token = settings.UPSTASH_REDIS_TOKEN
+        self.redis_url = settings.REDIS_URL
 
-        if not self.redis_url or not self.redis_token:
-            raise ValueError("Missing Upstash Redis environment variables")
+        if not self.redis_url:
+            raise ValueError("Missing REDIS_URL environment variable")
 
-        self.headers = {
-            "Authorization": f"Bearer {self.redis_token}",
-            "Content-Type": "application/json",
-        }
+        self._clients: dict[asyncio.AbstractEventLoop, Redis] = {}
+        self._closers: dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    @property
+    def client(self) -> Redis:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = Redis.from_url(
+                self.redis_url,
+                max_connections=32,
+                decode_responses=True,
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
+            self._clients[loop] = client
+            self._closers[loop] = loop.create_task(
+                self._close_on_shutdown(loop, client)
+            )
+        return client
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, client: Redis):
+        try:
+            await loop.create_future()
+        finally:
+            if self._clients.get(loop) is client:
+                self._clients.pop(loop, None)
+                self._closers.pop(loop, None)
+                await client.aclose()
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        closer = self._closers.pop(loop, None)
+        if closer is not None:
+            closer.cancel()
+        if client is not None:
+            await client.aclose()
 
     @retry(
         stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=10)
     )
     async def connect(self):
         async def handler():
-            async with httpx.AsyncClient() as client:
-                try:
-                    logger.info("Connecting to Upstash Redis...")
-                    res = await client.get(
-                        f"{self.redis_url}/ping", headers=self.headers
-                    )
-                    if res.status_code == 200 and res.json().get("result") == "PONG":
-                        logger.info("Connected to Upstash Redis.")
-                    else:
-                        raise ConnectionError("Upstash Redis ping failed.")
-                except Exception as e:
-                    logger.error("Redis connection error:", exc_info=e)
-                    raise
+            try:
+                logger.info("Connecting to Redis...")
+                if await self.client.ping():
+                    logger.info("Connected to Redis.")
+                else:
+                    raise ConnectionError("Redis ping failed.")
+            except Exception as e:
+                logger.error("Redis connection error:", exc_info=e)
+                raise
 
         await breaker.call(handler)
 
     async def get(self, key: str) -> Optional[str]:
         async def handler():
             try:
-                encoded_key = urllib.parse.quote(str(key))
-                async with httpx.AsyncClient() as client:
-                    res = await client.get(
-                        f"{self.redis_url}/get/{encoded_key}", headers=self.headers
-                    )
-                    if res.status_code == 200:
-                        return res.json().get("result")
-                    if res.status_code == 404:
-                        return None
-                    raise ConnectionError(f"Redis GET failed ({res.status_code})")
-            except httpx.RequestError as e:
-                logger.error("Network error during Redis GET:", exc_info=e)
-            except ConnectionError as e:
+                return await self.client.get(str(key))
+            except RedisConnectionError as e:
                 logger.error("Connection error during Redis GET:", exc_info=e)
-            except Exception as e:
+            except RedisError as e:
                 logger.error("Unexpected error during Redis GET:", exc_info=e)
             return None
 
         return await breaker.call(handler)
 
-    async def set(self, key: str, value: str, ttl: int = 3600) -> None:
+    async def set(self, key: str, value: str | bytes, ttl: int = 3600) -> None:
         if key is None or value is None:
             raise ValueError("Cache key and value cannot be None")
 
         async def handler():
             try:
-                encoded_key = urllib.parse.quote(str(key))
-                async with httpx.AsyncClient() as client:
-                    url = f"{self.redis_url}/set/{encoded_key}?ex={ttl}"
-
-                    res = await client.post(url, headers=self.headers, content=value)
-                    if res.status_code == 200:
-                        logger.debug("Cache set successfully for key: %s", key)
-                        return
-                    raise ConnectionError(f"Redis SET failed ({res.status_code})")
-            except httpx.RequestError as e:
-                logger.error("Network error during Redis SET:", exc_info=e)
-            except ConnectionError as e:
+                await self.client.set(str(key), value, ex=ttl)
+                logger.debug("Cache set successfully for key: %s", key)
+            except RedisConnectionError as e:
                 logger.error("Connection error during Redis SET:", exc_info=e)
-            except Exception as e:
+            except RedisError as e:
                 logger.error("Unexpected error during Redis SET:", exc_info=e)
 
         return await breaker.call(handler)
 
+    async def touch(self, key: str, value: str, ttl: int = 3600) -> bool:
+        async def handler():
+            try:
+                return bool(await self.client.expire(str(key), ttl))
+            except RedisConnectionError as e:
+                logger.error("Connection error during Redis EXPIRE:", exc_info=e)
+            except RedisError as e:
+                logger.error("Unexpected error during Redis EXPIRE:", exc_info=e)
+            return False
+
+        existed = await breaker.call(handler)
+        if not existed:
+            await self.set(key, value, ttl)
+        return bool(existed)
+
     async def delete(self, key: str) -> bool:
         async def handler():
             try:
-                encoded_key = urllib.parse.quote(str(key))
-                async with httpx.AsyncClient() as client:
-                    res = await client.post(
-                        f"{self.redis_url}/del/{encoded_key}", headers=self.headers
-                    )
-                    if res.status_code == 200:
-                        return True
-                    return False
-            except Exception as e:
+                return bool(await self.client.delete(str(key)))
+            except RedisError as e:
                 logger.error("Redis DELETE error:", exc_info=e)
                 return False
 
         return await breaker.call(handler)
 
+    async def pipeline(self, commands: list[list[str]]) -> list[Any]:
+        if not commands:
+            return []
+
+        async def handler():
+            try:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for command in commands:
+                        pipe.execute_command(*command)
+                    results = await pipe.execute(raise_on_error=False)
+                return [
+                    None if isinstance(result, Exception) else result
+                    for result in results
+                ]
+            except RedisConnectionError as e:
+                logger.error("Connection error during Redis pipeline:", exc_info=e)
+            except RedisError as e:
+                logger.error("Unexpected error during Redis pipeline:", exc_info=e)
+            return [None] * len(commands)
+
+        return await breaker.call(handler)
+
     async def get_json(self, key: str) -> Optional[Any]:
         data = await self.get(key)
         if not data:
             return None
         try:
-            return json.loads(data)
-        except json.JSONDecodeError:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON format in key: %s", key)
             return None
 
     async def set_json(self, key: str, value: Any, ttl: int = 3600) -> None:
         logger.debug("Setting JSON cache for key: %s", key)
-        data = json.dumps(value)
+        data = orjson.dumps(value, option=JSON_OPTIONS)
         await self.set(key, data, ttl)
        
 
+    async def mget_json(self, *keys: str) -> list[Optional[Any]]:
+        results = await self.pipeline([["GET", str(key)] for key in keys])
+        values = []
+        for key, data in zip(keys, results):
+            if not data:
+                values.append(None)
+                continue
+            try:
+                values.append(orjson.loads(data))
+            except orjson.JSONDecodeError:
+                logger.error("Invalid JSON format in key: %s", key)
+                values.append(None)
+        return values
+
+    async def mset_json(self, items: dict[str, Any], ttl: int = 3600) -> None:
+        await self.pipeline(
+            [
+                [
+                    "SET",
+                    str(key),
+                    orjson.dumps(value, option=JSON_OPTIONS).decode(),
+                    "EX",
+                    str(ttl),
+                ]
+                for key, value in items.items()
+            ]
+        )
+
     def set_json_sync(self, key: str, value: Any):
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.create_task(self.set_json(key, value))
-        else:
-            loop.run_until_complete(self.set_json(key, value))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.set_json(key, value))
+            return
+        task = loop.create_task(self.set_json(key, value))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
     async def delete_cache_keys_async(self, *keys: str):
         if not keys:
             return
-        unique_keys = set(keys)
-        await asyncio.gather(*(self.delete(key) for key in unique_keys))
+        unique_keys = {str(key) for key in keys}
+
+        async def handler():
+            try:
+                await self.client.delete(*unique_keys)
+            except RedisError as e:
+                logger.error("Redis DELETE error:", exc_info=e)
+
+        await breaker.call(handler)
 
     async def get_raw(self, key: str) -> Optional[bytes]:
         data = await self.get(key)
@@ -156,7 +238,7 @@ class Cache:
         if not isinstance(value, (bytes, bytearray)):
             raise TypeError("set_raw expects bytes")
 
-        encoded = base64.urlsafe_b64encode(value).decode("ascii")
+        encoded = base64.urlsafe_b64encode(value)
         await self.set(key, encoded, ttl)
         return {
             "key": key,
@@ -170,9 +252,7 @@ class Cache:
 
     async def ping(self) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                res = await client.get(f"{self.redis_url}/ping", headers=self.headers)
-                return res.status_code == 200 and res.json().get("result") == "PONG"
+            return bool(await self.client.ping())
         except Exception:
             return False
 
@@ -1,22 +1,36 @@
 import logging
-from traceback import print_exception
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class ErrorHandlerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.exception(f"Unhandled server error:{e}")
-
-            print_exception(type(e), e, e.__traceback__)
-            return Response(
+            logger.exception("Unhandled server error: %s", e)
+            if response_started:
+                raise
+            response = Response(
                 "Something went wrong on our end. Please try again.",
                 status_code=500,
             )
+            await response(scope, receive, send)
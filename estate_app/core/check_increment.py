@@ -1,30 +1,33 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 
+from cachetools import TTLCache
 from fastapi import HTTPException
 
 from .settings import settings
 
-resend_tracker: dict[str, dict] = {}
+resend_tracker: TTLCache[str, tuple[int, datetime | None]] = TTLCache(
+    maxsize=100_000, ttl=settings.LOCK_DURATION.total_seconds() * 2
+)
+resend_lock = asyncio.Lock()
 
 
 class CheckIncrementTimer:
     async def check_and_increment_resend(self, email: str) -> None:
-        now = datetime.now(timezone.utc)
-
-        info = resend_tracker.get(email, {"count": 0, "lock_until": None})
-
-        if info["lock_until"] and info["lock_until"] > now:
-            remaining = (info["lock_until"] - now).seconds
-            raise HTTPException(
-                status_code=429,
-                detail=f"Maximum resend attempts reached. Try again in {remaining} seconds.",
-            )
-
-        info["count"] = info.get("count", 0) + 1
-        if info["count"] >= settings.MAX_RESENDS:
-            info["lock_until"] = now + settings.LOCK_DURATION
-            info["count"] = 0
-        else:
-            info["lock_until"] = None
-
-        resend_tracker[email] = info
+        async with resend_lock:
+            now = datetime.now(timezone.utc)
+
+            count, lock_until = resend_tracker.get(email, (0, None))
+
+            if lock_until and lock_until > now:
+                remaining = (lock_until - now).seconds
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Maximum resend attempts reached. Try again in {remaining} seconds.",
+                )
+
+            count += 1
+            if count >= settings.MAX_RESENDS:
+                resend_tracker[email] = (0, now + settings.LOCK_DURATION)
+            else:
+                resend_tracker[email] = (count, None)
@@ -1,34 +1,35 @@
+from functools import partialmethod
+
 from fastapi import HTTPException
 from models.enums import UserRole
 
+ALL_ROLES = frozenset(
+    {
+        UserRole.ADMIN,
+        UserRole.USER,
+        UserRole.LANDLORD,
+        UserRole.TENANT,
+    }
+)
+
+REQUIRED_ROLES: dict[str, frozenset[UserRole]] = {
+    "admin": frozenset({UserRole.ADMIN}),
+    "authenticated": ALL_ROLES,
+}
+
 
 class CheckRolePermission:
-    async def check_admin(self, current_user):
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="Access Denied.")
-
-    async def check_authenticated(self, current_user):
-        if current_user.role not in {
-            UserRole.ADMIN,
-            UserRole.USER,
-            UserRole.LANDLORD,
-            UserRole.TENANT,
-        }:
-            raise HTTPException(status_code=403, detail="Access Denied")
+    async def enforce(self, kind: str, current_user, detail: str = "Access Denied"):
+        if current_user.role not in REQUIRED_ROLES[kind]:
+            raise HTTPException(status_code=403, detail=detail)
+
+    check_admin = partialmethod(enforce, "admin", detail="Access Denied.")
+    check_authenticated = partialmethod(enforce, "authenticated")
+
     async def check_login(self, current_user):
-        if current_user.role in {
-            UserRole.ADMIN,
-            UserRole.USER,
-            UserRole.LANDLORD,
-            UserRole.TENANT,
-        }:
+        if current_user.role in ALL_ROLES:
             raise HTTPException(status_code=403, detail="Already Logged In")
 
     async def check_role(self, role: UserRole):
-        if role not in {
-            UserRole.ADMIN,
-            UserRole.USER,
-            UserRole.LANDLORD,
-            UserRole.TENANT,
-        }:
+        if role not in ALL_ROLES:
             raise HTTPException(status_code=403, detail="Invalid Role")
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import time
 import uuid
 from pathlib import Path
@@ -12,6 +13,7 @@ from fastapi import HTTPException
 from core.settings import settings
 
 MAX_FILE_SIZE = 5 * 1024 * 1024
+DELETE_BATCH_SIZE = 100
 
 
 class CloudinaryClient:
@@ -22,6 +24,16 @@ class CloudinaryClient:
             api_secret=settings.CLOUDINARY_SECRET_KEY,
             secure=True,
         )
+        config = cloudinary.config()
+        self.api_secret = config.api_secret
+        self.api_key = config.api_key
+        self.cloud_name = config.cloud_name
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
 
     async def validate_signature_timestamp(
         self, timestamp: int | str, *, ttl_seconds: int = 30
@@ -45,7 +57,7 @@ class CloudinaryClient:
 
     async def connect(self) -> bool:
         try:
-            info = cloudinary.api.ping()
+            info = await self._run(cloudinary.api.ping)
             return info.get("status") == "ok"
         except Exception as e:
             raise HTTPException(500, f"Cloudinary connection failed: {e}")
@@ -81,18 +93,18 @@ class CloudinaryClient:
 
             signature = api_sign_request(
                 params_to_sign,
-                cloudinary.config().api_secret,
+                self.api_secret,
             )
 
             return {
                 "signature": signature,
                 "timestamp": timestamp,
-                "api_key": cloudinary.config().api_key,
+                "api_key": self.api_key,
                 "folder": folder,
                 "max_file_size": MAX_FILE_SIZE,
                 "eager": eager,
                 "allowed_formats": allowed_formats,
-                "cloud_name": cloudinary.config().cloud_name,
+                "cloud_name": self.cloud_name,
             }
 
         except Exception as e:
@@ -107,41 +119,41 @@ class CloudinaryClient:
         folder: str = "uploads",
     ) -> list[dict]:
         try:
-            signed_payloads: list[dict] = []
-            for _ in range(count):
-                allowed_formats = ["jpg", "jpeg", "png", "webp"]
+            allowed_formats = ["jpg", "jpeg", "png", "webp"]
 
-                timestamp = int(time.time())
-                await self.validate_signature_timestamp(
-                    timestamp=timestamp, ttl_seconds=30
-                )
+            timestamp = int(time.time())
+            await self.validate_signature_timestamp(
+                timestamp=timestamp, ttl_seconds=30
+            )
 
-                eager = "f_auto,q_auto"
+            eager = "f_auto,q_auto"
 
-                params_to_sign = {
-                    "timestamp": timestamp,
-                    "folder": folder,
-                    "eager": eager,
-                }
+            params_to_sign = {
+                "timestamp": timestamp,
+                "folder": folder,
+                "eager": eager,
+            }
 
-                signature = api_sign_request(
-                    params_to_sign,
-                    cloudinary.config().api_secret,
-                )
+            signature = api_sign_request(
+                params_to_sign,
+                self.api_secret,
+            )
 
-                signed_payloads.append(
-                    {
-                        "signature": signature,
-                        "timestamp": timestamp,
-                        "api_key": cloudinary.config().api_key,
-                        "folder": folder,
-                        "max_file_size": MAX_FILE_SIZE,
-                        "eager": eager,
-                        "allowed_formats": allowed_formats,
-                        "cloud_name": cloudinary.config().cloud_name,
-                        "resource_type": "image",
-                    }
-                )
+            payload = {
+                "signature": signature,
+                "timestamp": timestamp,
+                "api_key": self.api_key,
+                "folder": folder,
+                "max_file_size": MAX_FILE_SIZE,
+                "eager": eager,
+                "allowed_formats": allowed_formats,
+                "cloud_name": self.cloud_name,
+                "resource_type": "image",
+            }
+            signed_payloads = [
+                {**payload, "allowed_formats": list(allowed_formats)}
+                for _ in range(count)
+            ]
             return signed_payloads
 
         except Exception as e:
@@ -163,14 +175,14 @@ class CloudinaryClient:
 
             signature = cloudinary.utils.api_sign_request(
                 params_to_sign,
-                cloudinary.config().api_secret,
+                self.api_secret,
             )
 
             return {
                 "signature": signature,
                 "timestamp": timestamp,
-                "api_key": cloudinary.config().api_key,
-                "cloud_name": cloudinary.config().cloud_name,
+                "api_key": self.api_key,
+                "cloud_name": self.cloud_name,
                 "folder": folder,
                 "resource_type": "video",
                 
@@ -203,14 +215,14 @@ class CloudinaryClient:
 
             signature = api_sign_request(
                 params_to_sign,
-                cloudinary.config().api_secret,
+                self.api_secret,
             )
 
             return {
                 "signature": signature,
                 "timestamp": timestamp,
-                "api_key": cloudinary.config().api_key,
-                "cloud_name": cloudinary.config().cloud_name,
+                "api_key": self.api_key,
+                "cloud_name": self.cloud_name,
                 "folder": folder,
                 "resource_type": "raw",
                 "allowed_formats": ["pdf"],
@@ -224,16 +236,17 @@ class CloudinaryClient:
 
     async def upload_pdf_with_signature(
         self,
-        file_path: Path | None,
+        file: bytes | Path | None,
         folder: str = "receipts",
         public_id: str | None = None,
     ) -> dict:
-        if not file_path or not file_path.exists():
+        if not file or (isinstance(file, Path) and not file.exists()):
             raise HTTPException(500, "Generated PDF file not found")
 
         try:
-            result = cloudinary.uploader.upload(
-                str(file_path),
+            result = await self._run(
+                cloudinary.uploader.upload,
+                file if isinstance(file, bytes) else str(file),
                 resource_type="raw",
                 folder=folder,
                 public_id=public_id,
@@ -245,35 +258,48 @@ class CloudinaryClient:
 
     async def delete_image(self, public_id: str, resource_type:str) -> dict:
         try:
-            loop = asyncio.get_running_loop()
-
-            func = functools.partial(
+            return await self._run(
                 cloudinary.uploader.destroy,
                 public_id,
                 resource_type=resource_type,
                 invalidate=True,
             )
-
-            return await loop.run_in_executor(None, func)  
         except Exception as e:
             raise HTTPException(500, f"Failed to delete image: {e}")
 
-    async def delete_images(self, public_ids: list[str]) -> dict:
+    async def delete_images(
+        self, public_ids: list[str], resource_type: str = "image"
+    ) -> dict:
         if not public_ids:
             raise HTTPException(status_code=400, detail="No public_ids provided")
 
         try:
-            loop = asyncio.get_running_loop()
-
-            result = await loop.run_in_executor(
-                None,
-                lambda: cloudinary.api.delete_resources(public_ids, invalidate=True),
+            chunks = [
+                public_ids[i : i + DELETE_BATCH_SIZE]
+                for i in range(0, len(public_ids), DELETE_BATCH_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._run(
+                        cloudinary.api.delete_resources,
+                        chunk,
+                        resource_type=resource_type,
+                        invalidate=True,
+                    )
+                    for chunk in chunks
+                )
             )
 
+            deleted: dict = {}
+            partial = False
+            for result in results:
+                deleted.update(result.get("deleted") or {})
+                partial = partial or bool(result.get("partial"))
+
             return {
-                "deleted": result.get("deleted"),
-                "partial": result.get("partial"),
-                "raw": result,
+                "deleted": deleted,
+                "partial": partial,
+                "raw": results,
             }
 
         except Exception as e:
@@ -291,7 +317,7 @@ class CloudinaryClient:
         payload = f"{image_id}:{public_id}:{int(time.time()) + expires_in}"
         return api_sign_request(
             {"payload": payload},
-            cloudinary.config().api_secret,
+            self.api_secret,
         )
 
     def generate_signed_pdf_url(self, public_id: str, expires_in: int = 300) -> str:
@@ -304,7 +330,9 @@ class CloudinaryClient:
 
     async def resource_exists(self, public_id: str, resource_type: str = "raw") -> bool:
         try:
-            info = cloudinary.api.resource(public_id, resource_type=resource_type)
+            info = await self._run(
+                cloudinary.api.resource, public_id, resource_type=resource_type
+            )
             return True if info else False
             print(f"Details: {info}")
         except cloudinary.exceptions.NotFound:
@@ -333,7 +361,7 @@ class CloudinaryClient:
             if next_cursor:
                 params["next_cursor"] = next_cursor
 
-            return cloudinary.api.resources(**params)
+            return await self._run(cloudinary.api.resources, **params)
 
         except Exception as e:
             raise HTTPException(
@@ -349,7 +377,7 @@ class CloudinaryClient:
 
     async def safe_delete_many_cloudinary(self, public_ids: list[str], resource_type:str):
         try:
-            await self.delete_images(public_ids)
+            await self.delete_images(public_ids, resource_type=resource_type)
         except Exception:
             pass
 
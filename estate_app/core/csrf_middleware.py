@@ -1,71 +1,106 @@
-from datetime import datetime, timedelta, timezone
-from typing import Set
+import time
+from collections import OrderedDict
+from typing import Iterable
 
 import jwt
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+DECODE_CACHE_SIZE = 4096
+REFRESH_WINDOW_SECONDS = 120
 
-class AutoRefreshAccessTokenMiddleware(BaseHTTPMiddleware):
+_DECODE_CACHE: OrderedDict[str, dict] = OrderedDict()
+
+
+def _decode_cached(token: str, secret_key: str, algorithm: str) -> dict:
+    payload = _DECODE_CACHE.get(token)
+    if payload is not None:
+        _DECODE_CACHE.move_to_end(token)
+        return payload
+
+    payload = jwt.decode(
+        token,
+        secret_key,
+        algorithms=[algorithm],
+        options={"verify_exp": False},
+    )
+    _DECODE_CACHE[token] = payload
+    if len(_DECODE_CACHE) > DECODE_CACHE_SIZE:
+        _DECODE_CACHE.popitem(last=False)
+    return payload
+
+
+class AutoRefreshAccessTokenMiddleware:
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         secret_key: str,
         algorithm: str = "HS256",
         access_exp_minutes: int = 10,
         secure_cookies: bool = True,
-        skip_paths: Set[str] = None,
+        skip_paths: Iterable[str] | None = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.secret_key = secret_key
         self.algorithm = algorithm
-        self.access_exp = timedelta(minutes=access_exp_minutes)
+        self.access_exp_seconds = access_exp_minutes * 60
         self.secure_cookies = secure_cookies
-        self.skip_paths = skip_paths or {"/logout", "/api/auth/logout"}
+        self.skip_paths = frozenset(skip_paths or ("/logout", "/api/auth/logout"))
+        self.access_cookie_attrs = (
+            f"; HttpOnly; Max-Age={self.access_exp_seconds}; Path=/; SameSite=lax"
+            + ("; Secure" if secure_cookies else "")
+        )
 
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in self.skip_paths:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
 
-        access_token = request.cookies.get("access_token")
-        refresh_token = request.cookies.get("refresh_token")
+        cookies = self._read_cookies(scope)
+        access_token = cookies.get("access_token")
+        refresh_token = cookies.get("refresh_token")
 
+        new_access = None
         if access_token:
             new_access = self._try_refresh_access_token(access_token)
-            if new_access:
-                response = await call_next(request)
-                self._set_access_cookie(response, new_access)
-                return response
 
-        if refresh_token:
+        if not new_access and refresh_token:
             new_access = self._try_create_access_from_refresh(refresh_token)
-            if new_access:
-                response = await call_next(request)
-                self._set_access_cookie(response, new_access)
-                return response
-            else:
+            if not new_access:
                 # if request.url.path.startswith("/api/"):
                 resp = JSONResponse(
                     {"detail": "Refresh token expired"}, status_code=401
                 )
                 resp.delete_cookie("refresh_token")
-                return resp
+                await resp(scope, receive, send)
+                return
 
-        response = await call_next(request)
-        return response
+        if not new_access:
+            await self.app(scope, receive, send)
+            return
+
+        cookie = f"access_token={new_access}{self.access_cookie_attrs}"
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("set-cookie", cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _read_cookies(scope: Scope) -> dict[str, str]:
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                return cookie_parser(value.decode("latin-1"))
+        return {}
 
     def _try_refresh_access_token(self, token: str) -> str | None:
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm],
-                options={"verify_exp": False},
-            )
-            exp = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
-
-            if exp - datetime.now(timezone.utc) < timedelta(minutes=2):
+            payload = _decode_cached(token, self.secret_key, self.algorithm)
+            if payload["exp"] - int(time.time()) < REFRESH_WINDOW_SECONDS:
                 return self._create_new_access_token(payload["sub"])
         except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
             return None
@@ -73,7 +108,10 @@ class AutoRefreshAccessTokenMiddleware(BaseHTTPMiddleware):
 
     def _try_create_access_from_refresh(self, token: str) -> str | None:
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = _decode_cached(token, self.secret_key, self.algorithm)
+            exp = payload.get("exp")
+            if exp is not None and exp <= time.time():
+                return None
             return self._create_new_access_token(payload["sub"])
         except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
             return None
@@ -83,18 +121,8 @@ class AutoRefreshAccessTokenMiddleware(BaseHTTPMiddleware):
             {
                 "sub": user_id,
                 "type": "access",
-                "exp": datetime.now(timezone.utc) + self.access_exp,
+                "exp": int(time.time()) + self.access_exp_seconds,
             },
             self.secret_key,
             algorithm=self.algorithm,
         )
-
-    def _set_access_cookie(self, response: Response, token: str):
-        response.set_cookie(
-            key="access_token",
-            value=token,
-            httponly=True,
-            secure=self.secure_cookies,
-            samesite="lax",
-            max_age=int(self.access_exp.total_seconds()),
-        )
@@ -3,12 +3,12 @@ from datetime import date
 from dateutil.relativedelta import relativedelta
 from models.enums import RentCycle
 
+_CYCLE_DELTAS = {
+    RentCycle.MONTHLY: relativedelta(months=1),
+    RentCycle.YEARLY: relativedelta(years=1),
+}
+_WEEK = relativedelta(weeks=1)
 
-def calculate_expiry(start_date: date, rent_cycle: RentCycle) -> date:
-    if rent_cycle == RentCycle.MONTHLY:
-        return start_date + relativedelta(months=1)
-
-    if rent_cycle == RentCycle.YEARLY:
-        return start_date + relativedelta(years=1)
 
-    return start_date + relativedelta(weeks=1)
+def calculate_expiry(start_date: date, rent_cycle: RentCycle) -> date:
+    return start_date + _CYCLE_DELTAS.get(rent_cycle, _WEEK)
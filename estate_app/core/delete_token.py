@@ -7,29 +7,30 @@ from .settings import settings
 
 class DeleteTokenGenerator:
     SECRET_KEY = (settings.SECRET_KEY or "").encode("utf-8")
+    _HMAC = hmac.new(SECRET_KEY, digestmod=hashlib.sha256)
 
+    @classmethod
+    def _sign(cls, image_id: str, expiry) -> bytes:
+        mac = cls._HMAC.copy()
+        mac.update(f"{image_id}:{expiry}".encode("utf-8"))
+        return mac.digest()
 
     @classmethod
-    async def generate_token(cls, image_id: str, expires_in: int = 300) -> str:
+    def generate_token(cls, image_id: str, expires_in: int = 300) -> str:
         expiry: int = int(time.time()) + expires_in
-        message = f"{image_id}:{expiry}".encode("utf-8")
-        digest: str = hmac.new(cls.SECRET_KEY, message, hashlib.sha256).hexdigest()
-        return f"{digest}:{expiry}"
+        return f"{cls._sign(image_id, expiry).hex()}:{expiry}"
 
     @classmethod
-    async def validate_token(cls, image_id: str, token: str) -> bool:
-        try:
-            digest, expiry_str = token.split(":")
-            expiry: int = int(expiry_str)
-        except ValueError:
+    def validate_token(cls, image_id: str, token: str) -> bool:
+        digest_hex, sep, expiry_str = token.rpartition(":")
+        if not sep:
             return False
 
-        if time.time() > expiry:
+        try:
+            if time.time() > int(expiry_str):
+                return False
+            supplied = bytes.fromhex(digest_hex)
+        except ValueError:
             return False
 
-        message = f"{image_id}:{expiry}".encode("utf-8")
-        expected_digest: str = hmac.new(
-            cls.SECRET_KEY, message, hashlib.sha256
-        ).hexdigest()
-
-        return hmac.compare_digest(expected_digest, digest)
+        return hmac.compare_digest(cls._sign(image_id, expiry_str), supplied)
@@ -1,13 +1,31 @@
+import logging
+
 from core.settings import settings
 
+from .batch_drainer import BatchDrainer
 from .rabbitmq import rabbitmq
 
+logger = logging.getLogger(__name__)
 
-async def publish_event(event_name: str, data: dict):
-    publish = await rabbitmq.publish_json(
-        exchange_name=settings.RABBITMQ_MAIN_EXCHANGE,
-        routing_key=event_name,
-        data=data,
-    )
 
-    return publish
+class EventPublisher(BatchDrainer):
+    def __init__(self, batch_size: int = 256, linger: float = 0.01):
+        super().__init__(batch_size, linger)
+
+    async def publish(self, event_name: str, data: dict):
+        await self.submit((event_name, data))
+
+    async def _flush(self, items: list[tuple[str, dict]]):
+        if not items:
+            return
+        try:
+            await rabbitmq.publish_json_many(settings.RABBITMQ_MAIN_EXCHANGE, items)
+        except Exception:
+            logger.exception("Failed to publish %d events", len(items))
+
+
+event_publisher = EventPublisher()
+
+
+async def publish_event(event_name: str, data: dict):
+    await event_publisher.publish(event_name, data)
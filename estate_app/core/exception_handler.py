@@ -1,21 +1,20 @@
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 
 class ValidationErrorHandler:
     async def __call__(self, request: Request, exc: RequestValidationError):
-
-        errors = []
-
-        for err in exc.errors():
-            errors.append({
+        errors = [
+            {
                 "loc": err.get("loc"),
-                "msg": str(err.get("msg")),   
+                "msg": str(err.get("msg")),
                 "type": err.get("type"),
-            })
+            }
+            for err in exc.errors()
+        ]
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "success": False,
@@ -2,46 +2,44 @@ import asyncio
 import hashlib
 
 import aiohttp
-import requests
 from fastapi import HTTPException
 
-from core.asyncio_threads import AsyncioBaseService
+HASH_CHUNK_SIZE = 65536
 
 
 class ComputeFileHash:
-    def __init__(self):
-        self.asyncio_threads = AsyncioBaseService()
+    _session: aiohttp.ClientSession | None = None
+    _session_loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            cls._session_loop = loop
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls):
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+        cls._session_loop = None
 
     async def compute_file_hash_async(self, file_url: str) -> str:
-        async with aiohttp.ClientSession() as session:
+        session = await self._get_session()
+        digest = hashlib.sha256()
+        try:
             async with session.get(file_url) as resp:
                 if resp.status != 200:
                     raise HTTPException(status_code=400, detail="Failed to fetch file")
 
-                content = await resp.read()
-                return hashlib.sha256(content).hexdigest()
-
-    def compute_file_hash_sync(self, file_url: str) -> str:
-        try:
-            resp = requests.get(file_url, timeout=30)
-        except requests.RequestException:
-            raise HTTPException(status_code=400, detail="Failed to fetch file")
-
-        if resp.status_code != 200:
+                async for chunk in resp.content.iter_chunked(HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             raise HTTPException(status_code=400, detail="Failed to fetch file")
 
-        return hashlib.sha256(resp.content).hexdigest()
-
-    async def compute_file_hash(self, file_url: str, executor=None) -> str:
-        try:
-            return await self.asyncio_threads.run_blocking(
-                self.compute_file_hash_sync,
-                file_url,
-                executor=executor,
-            )
-        except HTTPException:
-            raise
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            return await self.compute_file_hash_async(file_url)
+        return digest.hexdigest()
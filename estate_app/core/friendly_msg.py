@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 FRIENDLY_MESSAGES = {
     "ConnectionError": "Unable to connect to a required service. Please try again later.",
     "TimeoutError": "The request took too long. Please try again later.",
@@ -8,8 +10,19 @@ FRIENDLY_MESSAGES = {
 }
 
 
-def get_friendly_message(error: Exception) -> str:
-    for key, msg in FRIENDLY_MESSAGES.items():
-        if key.lower() in str(type(error)).lower():
+DEFAULT_MESSAGE = "Something went wrong on our end. Please try again."
+
+_LOWER_KEYS = [(key.lower(), msg) for key, msg in FRIENDLY_MESSAGES.items()]
+
+
+@lru_cache(maxsize=256)
+def _lookup_by_type(tp: type) -> str:
+    name = f"{tp.__module__}.{tp.__qualname__}".lower()
+    for key, msg in _LOWER_KEYS:
+        if key in name:
             return msg
-    return "Something went wrong on our end. Please try again."
\ No newline at end of file
+    return DEFAULT_MESSAGE
+
+
+def get_friendly_message(error: Exception) -> str:
+    return _lookup_by_type(type(error))
\ No newline at end of file
@@ -1,20 +1,71 @@
+import asyncio
+import hashlib
+
 import httpx
+from cachetools import TTLCache
+from .cache import cache
 from .settings import settings
 from shapely.geometry import Point
 
+GEOAPIFY_URL = "https://api.geoapify.com/v1/geocode/search"
+GEOCODE_CACHE_TTL = 86400
+
+_geocode_cache: TTLCache[str, tuple[float, float]] = TTLCache(
+    maxsize=10_000, ttl=GEOCODE_CACHE_TTL
+)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client_loop = loop
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_client():
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def geocode_cache_key(address: str, provider: str = "geoapify") -> str:
+    digest = hashlib.sha1(address.strip().lower().encode("utf-8")).hexdigest()
+    return f"estate:geo:{provider}:{digest}"
+
 
 async def geocode_address(address: str) -> Point:
-    url = "https://api.geoapify.com/v1/geocode/search"
+    key = geocode_cache_key(address)
+    coords = _geocode_cache.get(key)
+    if coords is None:
+        coords = await cache.get_json(key)
+        if coords is None:
+            coords = await _fetch_coordinates(address)
+            await cache.set_json(key, coords, ttl=GEOCODE_CACHE_TTL)
+        coords = tuple(coords)
+        _geocode_cache[key] = coords
+    return Point(*coords)
+
+
+async def _fetch_coordinates(address: str) -> list[float]:
     params = {
         "text": address,
         "apiKey": settings.GEOAPIFY_API_KEY,
         "limit": 1,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+    response = await _get_client().get(GEOAPIFY_URL, params=params)
+    response.raise_for_status()
+    data = response.json()
 
     features = data.get("features")
     if not features:
@@ -26,4 +77,4 @@ async def geocode_address(address: str) -> Point:
 
     lon = geometry["coordinates"][0]
     lat = geometry["coordinates"][1]
-    return Point(lon, lat)
\ No newline at end of file
+    return [lon, lat]
\ No newline at end of file
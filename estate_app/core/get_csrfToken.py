@@ -7,12 +7,17 @@ from .settings import settings
 
 csrf_router = APIRouter(tags=["CSRF TOKEN"])
 
+_CSRF_MAX_AGE = settings.CSRF_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+_CSRF_COOKIE_ATTRS = f"; Max-Age={_CSRF_MAX_AGE}; Path=/; SameSite=lax" + (
+    "; Secure" if settings.SECURE_COOKIES else ""
+)
+
 
 @csrf_router.get("/csrf_token")
 async def get_csrf_token(request: Request):
     try:
-        csrf_token = secrets.token_hex(32)
-        
+        csrf_token = secrets.token_urlsafe(32)
+
         request.session["csrf_token"] = csrf_token
 
         response = JSONResponse(
@@ -21,20 +26,10 @@ async def get_csrf_token(request: Request):
                 "Access-Control-Allow-Origin": settings.FRONTEND_URL,
                 "Access-Control-Allow-Credentials": "true",
                 "Cache-Control": "no-store",
+                "Set-Cookie": f"csrf_token={csrf_token}{_CSRF_COOKIE_ATTRS}",
             },
         )
 
-        response.set_cookie(
-            key="csrf_token",
-            value=csrf_token,
-            httponly=False,
-            secure=settings.SECURE_COOKIES,
-            samesite="lax",
-            max_age=settings.CSRF_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-        )
-        
-
-
         return response
 
     except Exception as e:
@@ -1,6 +1,5 @@
 from fastapi import Depends, HTTPException, WebSocket, Request
 from models.models import User
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .get_db import get_db_async
@@ -20,11 +19,7 @@ async def get_current_user_for_login(
     except Exception:
         return None
 
-    result = await db.execute(select(User).where(User.id == user_id))
-
-    user = result.scalars().first()
-
-    return user
+    return await db.get(User, user_id)
 
 
 async def get_current_user(
@@ -35,8 +30,7 @@ async def get_current_user(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user ID format in token")
 
-    user = await db.execute(select(User).where(User.id == user_uuid))
-    user_result = user.scalars().first()
+    user_result = await db.get(User, user_uuid)
 
     if not user_result:
         raise HTTPException(status_code=404, detail="Not Authenticated")
@@ -52,8 +46,7 @@ async def passkey_get_current_user(
         user_uuid = user_id
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user ID format in token")
-    user = await db.execute(select(User).where(User.id == user_uuid))
-    user_result = user.scalars().first()
+    user_result = await db.get(User, user_uuid)
     if not user_result:
         raise HTTPException(status_code=404, detail="User not found")
     return user_result
@@ -75,8 +68,7 @@ async def get_current_user_ws(
         await websocket.close(code=4401)
         raise RuntimeError("Invalid token")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await db.get(User, user_id)
 
     if not user:
         await websocket.close(code=4401)
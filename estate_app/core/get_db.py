@@ -14,7 +14,14 @@ RENDER_DATABASE_URL = settings.RENDER_DATABASE_URL
 async_engine: AsyncEngine = create_async_engine(
     RENDER_DATABASE_URL,
     echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -1,8 +1,10 @@
 import uuid
-import asyncio
 from core.get_db import AsyncSessionLocal
 from core.file_hash import ComputeFileHash
-from core.cloudinary_setup import CloudinaryClient
+from core.cloudinary_setup import cloudinary_client
+
+compute_file_hash = ComputeFileHash()
+
 
 class AsyncioHashAndUpdate:
     async def hash_and_dedupe_profile_pic(
@@ -13,15 +15,10 @@ class AsyncioHashAndUpdate:
         profile_pic_path: str,
         public_id: str,
     ):
-        compute_file_hash = ComputeFileHash()
-        cloudinary=CloudinaryClient()
         try:
             
-            loop = asyncio.get_running_loop()
-            new_hash = await loop.run_in_executor(
-                None,
-                compute_file_hash.compute_file_hash_sync,
-                profile_pic_path,
+            new_hash = await compute_file_hash.compute_file_hash_async(
+                profile_pic_path
             )
 
             async with AsyncSessionLocal() as db:
@@ -31,7 +28,7 @@ class AsyncioHashAndUpdate:
 
                 if existing and existing.id != profile_id:
                     
-                    await cloudinary.safe_delete_cloudinary(public_id, "images")
+                    await cloudinary_client.safe_delete_cloudinary(public_id, "images")
                     await repo.delete(user_id, profile_id)
                     await repo.db_commit()
                     return
@@ -41,4 +38,4 @@ class AsyncioHashAndUpdate:
                 await repo.db_commit()
 
         except Exception:
-            await cloudinary.safe_delete_cloudinary(public_id, "images")
+            await cloudinary_client.safe_delete_cloudinary(public_id, "images")
@@ -13,9 +13,15 @@ from services.lga_service import LGAService
 from services.state_services import StateService
 from sms_notify.sms_service import send_sms
 
+from .blacklist_queue import blacklist_queue
 from .cache import cache
 from .cloudinary_setup import cloudinary_client
+from .event_publish import event_publisher
+from .file_hash import ComputeFileHash
+from .geoapify import close_client as close_geoapify_client
 from .get_db import AsyncSessionLocal
+from .pdf_generate import ensure_receipt_dir
+from .redis_idempotency import RedisIdempotency
 
 logger = logging.getLogger("startup")
 
@@ -24,6 +30,11 @@ logger = logging.getLogger("startup")
 async def lifespan(app: FastAPI):
     logger.info("Waiting for application startup...")
 
+    try:
+        await admin_manager.mount(app)
+    except Exception:
+        logger.exception("Admin panels could not be mounted")
+
     try:
         await admin_manager.connect_redis()
     except Exception:
@@ -43,6 +54,13 @@ async def lifespan(app: FastAPI):
     except Exception:
         logger.exception("Failed to clean up blacklisted tokens")
 
+    blacklist_queue.start()
+
+    try:
+        ensure_receipt_dir()
+    except Exception:
+        logger.exception("Failed to create receipts directory")
+
     try:
         await send_sms.connect()
         await send_sms.ping()
@@ -57,11 +75,13 @@ async def lifespan(app: FastAPI):
     except Exception:
         logger.exception("RabbitMQ connection failed")
 
+    event_publisher.start()
+
     try:
         await cache.connect()
-        logger.info("Upstash Redis connected.")
+        logger.info("Redis cache connected.")
     except Exception:
-        logger.exception("Upstash Redis connection failed")
+        logger.exception("Redis cache connection failed")
     
 
     try:
@@ -98,8 +118,38 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    try:
+        await blacklist_queue.stop()
+    except Exception:
+        logger.exception("Failed to flush blacklisted tokens queue")
+
+    try:
+        await event_publisher.stop()
+    except Exception:
+        logger.exception("Failed to flush pending events")
+
     try:
         if rabbitmq.connection and not rabbitmq.connection.is_closed:
             await rabbitmq.connection.close()
     except Exception:
         logger.exception("Failed to close RabbitMQ connection")
+
+    try:
+        await cache.close()
+    except Exception:
+        logger.exception("Failed to close Redis cache client")
+
+    try:
+        await ComputeFileHash.close()
+    except Exception:
+        logger.exception("Failed to close file hash HTTP session")
+
+    try:
+        await close_geoapify_client()
+    except Exception:
+        logger.exception("Failed to close Geoapify HTTP client")
+
+    try:
+        await RedisIdempotency.close()
+    except Exception:
+        logger.exception("Failed to close idempotency HTTP client")
@@ -2,9 +2,17 @@ import asyncio
 
 from geopy.geocoders import Nominatim
 
+from .cache import cache
+from .geoapify import GEOCODE_CACHE_TTL, geocode_cache_key
+
+geolocator = Nominatim(user_agent="venue_app")
+
 
 async def geocode_location(address: str):
-    geolocator = Nominatim(user_agent="venue_app")
+    key = geocode_cache_key(address, provider="nominatim")
+    cached = await cache.get_json(key)
+    if cached is not None:
+        return cached
 
     def _geocode():
         return geolocator.geocode(address, addressdetails=True)
@@ -14,10 +22,12 @@ async def geocode_location(address: str):
     if not location:
         return None
 
-    return {
+    result = {
         "point": f"POINT({location.longitude} {location.latitude})",
         "latitude": location.latitude,
         "longitude": location.longitude,
         "display_name": location.raw.get("display_name"),
         "address": location.raw.get("address", {})
-    }
\ No newline at end of file
+    }
+    await cache.set_json(key, result, ttl=GEOCODE_CACHE_TTL)
+    return result
\ No newline at end of file
@@ -12,4 +12,4 @@ class ORMMapper:
 
     @staticmethod
     def many(items: Iterable, schema: Type[T]) -> list[T]:
-        return [schema.model_validate(item) for item in items]
+        return list(map(schema.model_validate, items))
@@ -3,16 +3,14 @@ from models.models import User
 
 
 class NameMatcher:
-    SPLIT_RE = re.compile(r"[\s\-]+")
+    HYPHEN_TO_SPACE = str.maketrans("-", " ")
 
-    @classmethod
-    def normalize(cls, val: str | None) -> list[str]:
+    @staticmethod
+    def normalize(val: str | None) -> list[str]:
         if not val:
             return []
 
-        return [
-            part.strip().lower() for part in cls.SPLIT_RE.split(val) if part.strip()
-        ]
+        return val.translate(NameMatcher.HYPHEN_TO_SPACE).lower().split()
 
     @classmethod
     async def names_match(
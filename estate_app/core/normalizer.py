@@ -1,20 +1,17 @@
 import re
 
+_SUFFIX_RE = re.compile(r"\b(plc|limited|ltd|nigeria|nig|\(nigeria\))\b")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]+")
+_SEPARATORS = str.maketrans({"/": " ", "-": " "})
+
+
 def normalize_bank_name(name: str) -> str:
-   
     if not name:
         return ""
-    
-    cleaned = name.lower().strip()
-    #
-    cleaned = re.sub(r'\b(plc|limited|ltd|nigeria|nig|plc|\(nigeria\))\b', '', cleaned, flags=re.IGNORECASE)
-    
-    cleaned = cleaned.replace("&", "and").replace("/", " ").replace("-", " ")
-    
-    cleaned = re.sub(r'[^a-z0-9\s]', '', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    return cleaned
 
+    cleaned = _SUFFIX_RE.sub("", name.lower().translate(_SEPARATORS))
+    cleaned = _NON_ALNUM_RE.sub("", cleaned.replace("&", "and"))
+    return " ".join(cleaned.split())
 
 
 BANK_ALIASES = {
@@ -76,13 +73,7 @@ BANK_ALIASES_REVERSE = {v: k for k, v in BANK_ALIASES.items() if len(k) <= 10}
 def get_canonical_bank_name(user_input: str) -> str:
    
     normalized = normalize_bank_name(user_input)
-    
-   
-    if normalized in BANK_ALIASES:
-        return BANK_ALIASES[normalized]
-    
-   
-    return normalized
+    return BANK_ALIASES.get(normalized, normalized)
 
 
 
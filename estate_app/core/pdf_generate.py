@@ -1,4 +1,9 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
+from typing import BinaryIO
 
 from reportlab.graphics.barcode import code128
 from reportlab.lib import colors
@@ -7,7 +12,6 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
 from reportlab.platypus import (
-    Image,
     Paragraph,
     SimpleDocTemplate,
     Spacer,
@@ -16,51 +20,173 @@ from reportlab.platypus import (
 )
 
 BASE_PATH = Path("media/receipts")
-BASE_PATH.mkdir(parents=True, exist_ok=True)
 
 
-class ReceiptGenerator:
-    @staticmethod
-    def _payment_context_paragraph(receipt, property, styles):
-        context = receipt.payment_context
+def ensure_receipt_dir():
+    BASE_PATH.mkdir(parents=True, exist_ok=True)
 
-        if context == "FULL_RENT":
-            return Paragraph(
-                "This receipt confirms a full rent payment for the period stated above.",
-                styles["Normal"],
-            )
 
-        if context == "HALF_RENT":
-            return Paragraph(
-                f"This receipt confirms an initial part-payment of rent for "
-                f"<b>{property.title}</b>. "
-                f"The tenant has made a minimum rent payment and is expected to "
-                f"clear the remaining balance.",
-                styles["Normal"],
-            )
+BARCODE_HEIGHT = 20 * mm
+BARCODE_BAR_WIDTH = 0.6
 
-        if context == "OUTSTANDING_BALANCE":
-            return Paragraph(
-                f"This receipt confirms a rent balance settlement for "
-                f"<b>{property.title}</b>. "
-                f"The tenant is paying off an outstanding rent debt.",
-                styles["Normal"],
-            )
+_FMT_NGN = "₦{:,.2f}".format
+
+_STYLES = getSampleStyleSheet()
+
+_STYLES.add(
+    ParagraphStyle(
+        name="TitleStyle",
+        fontSize=18,
+        alignment=TA_CENTER,
+        spaceAfter=12,
+        textColor=colors.HexColor("#1F2937"),
+    )
+)
+
+_STYLES.add(
+    ParagraphStyle(
+        name="SectionHeader",
+        fontSize=12,
+        spaceBefore=14,
+        spaceAfter=6,
+        textColor=colors.HexColor("#111827"),
+        fontName="Helvetica-Bold",
+    )
+)
 
-        return Paragraph(
-            "This receipt confirms a rent payment for the period stated above.",
-            styles["Normal"],
+_STYLES.add(
+    ParagraphStyle(
+        name="Meta",
+        fontSize=9,
+        alignment=TA_RIGHT,
+        textColor=colors.grey,
+    )
+)
+
+_PROPERTY_TS = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+)
+
+_TENANT_TS = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
+    ]
+)
+
+
+def _payment_table_style(status_color) -> TableStyle:
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
+            ("TEXTCOLOR", (1, -1), (1, -1), colors.green),
+            ("TEXTCOLOR", (1, 3), (1, 3), status_color),
+        ]
+    )
+
+
+_PAYMENT_TS = {
+    True: _payment_table_style(colors.green),
+    False: _payment_table_style(colors.orange),
+}
+
+_CONTEXT_TEMPLATES = {
+    "FULL_RENT": (
+        "This receipt confirms a full rent payment for the period stated above."
+    ),
+    "HALF_RENT": (
+        "This receipt confirms an initial part-payment of rent for "
+        "<b>{title}</b>. "
+        "The tenant has made a minimum rent payment and is expected to "
+        "clear the remaining balance."
+    ),
+    "OUTSTANDING_BALANCE": (
+        "This receipt confirms a rent balance settlement for "
+        "<b>{title}</b>. "
+        "The tenant is paying off an outstanding rent debt."
+    ),
+}
+
+_DEFAULT_CONTEXT_TEMPLATE = (
+    "This receipt confirms a rent payment for the period stated above."
+)
+
+
+class ReceiptGenerator:
+    @staticmethod
+    def _payload(receipt) -> SimpleNamespace:
+        property = receipt.property
+        tenant = receipt.tenant
+        return SimpleNamespace(
+            reference_number=receipt.reference_number,
+            expected_amount=receipt.expected_amount,
+            amount_paid=receipt.amount_paid,
+            fully_paid=receipt.fully_paid,
+            barcode_reference=receipt.barcode_reference,
+            created_at=receipt.created_at,
+            payment_context=receipt.payment_context,
+            month_paid_for=receipt.month_paid_for,
+            year_paid_for=receipt.year_paid_for,
+            rent_duration_months=receipt.rent_duration_months,
+            property=SimpleNamespace(
+                title=property.title,
+                address=property.address,
+                state=SimpleNamespace(name=property.state.name),
+                lga=SimpleNamespace(name=property.lga.name),
+                property_type=property.property_type,
+                owner=SimpleNamespace(full_name=property.owner.full_name),
+                managed_by=SimpleNamespace(full_name=property.managed_by.full_name),
+                house_type=property.house_type,
+            ),
+            tenant=SimpleNamespace(
+                first_name=tenant.first_name,
+                middle_name=tenant.middle_name,
+                last_name=tenant.last_name,
+                phone_number=tenant.phone_number,
+                rent_cycle=tenant.rent_cycle,
+                rent_start_date=tenant.rent_start_date,
+                rent_expiry_date=tenant.rent_expiry_date,
+            ),
         )
 
+    @classmethod
+    def generate_pdfs(cls, receipts) -> list[bytes]:
+        payloads = [cls._payload(receipt) for receipt in receipts]
+        if not payloads:
+            return []
+        workers = min(len(payloads), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.generate_pdf, payloads))
+
     @staticmethod
-    def generate_pdf(receipt):
+    def _payment_context_paragraph(receipt, property, styles):
+        template = _CONTEXT_TEMPLATES.get(
+            receipt.payment_context, _DEFAULT_CONTEXT_TEMPLATE
+        )
+        return Paragraph(template.format(title=property.title), styles["Normal"])
+
+    @staticmethod
+    def write_pdf(receipt) -> Path:
         file_path = BASE_PATH / f"{receipt.reference_number}.pdf"
+        file_path.write_bytes(ReceiptGenerator.generate_pdf(receipt))
+        return file_path
+
+    @staticmethod
+    def generate_pdf(receipt, out: BinaryIO | None = None) -> bytes:
+        buf = out or BytesIO()
         balance = receipt.expected_amount - receipt.amount_paid
         payment_status = "FULLY PAID" if receipt.fully_paid else "PARTIAL PAYMENT"
-        status_color = colors.green if receipt.fully_paid else colors.orange
 
         doc = SimpleDocTemplate(
-            str(file_path),
+            buf,
             pagesize=A4,
             rightMargin=30,
             leftMargin=30,
@@ -68,37 +194,7 @@ class ReceiptGenerator:
             bottomMargin=30,
         )
 
-        styles = getSampleStyleSheet()
-
-        styles.add(
-            ParagraphStyle(
-                name="TitleStyle",
-                fontSize=18,
-                alignment=TA_CENTER,
-                spaceAfter=12,
-                textColor=colors.HexColor("#1F2937"),
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                name="SectionHeader",
-                fontSize=12,
-                spaceBefore=14,
-                spaceAfter=6,
-                textColor=colors.HexColor("#111827"),
-                fontName="Helvetica-Bold",
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                name="Meta",
-                fontSize=9,
-                alignment=TA_RIGHT,
-                textColor=colors.grey,
-            )
-        )
+        styles = _STYLES
 
         elements = []
 
@@ -114,8 +210,8 @@ class ReceiptGenerator:
 
         barcode = code128.Code128(
             barcode_value,
-            barHeight=20 * mm,
-            barWidth=0.6,
+            barHeight=BARCODE_HEIGHT,
+            barWidth=BARCODE_BAR_WIDTH,
         )
 
         elements.append(Spacer(1, 10))
@@ -154,16 +250,7 @@ class ReceiptGenerator:
             colWidths=[120, None],
         )
 
-        property_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
-        )
+        property_table.setStyle(_PROPERTY_TS)
 
         elements.append(property_table)
         elements.append(Spacer(1, 14))
@@ -187,15 +274,7 @@ class ReceiptGenerator:
             colWidths=[120, None],
         )
 
-        tenant_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
-                ]
-            )
-        )
+        tenant_table.setStyle(_TENANT_TS)
 
         elements.append(tenant_table)
         elements.append(Spacer(1, 14))
@@ -203,9 +282,9 @@ class ReceiptGenerator:
         elements.append(Paragraph("Payment Summary", styles["SectionHeader"]))
         payment_table = Table(
             [
-                ["Expected Amount", f"₦{receipt.expected_amount:,.2f}"],
-                ["Amount Paid", f"₦{receipt.amount_paid:,.2f}"],
-                ["Outstanding Balance", f"₦{max(balance, 0):,.2f}"],
+                ["Expected Amount", _FMT_NGN(receipt.expected_amount)],
+                ["Amount Paid", _FMT_NGN(receipt.amount_paid)],
+                ["Outstanding Balance", _FMT_NGN(max(balance, 0))],
                 ["Payment Status", payment_status],
                 ["Month / Year", f"{receipt.month_paid_for}/{receipt.year_paid_for}"],
                 ["Duration", f"{receipt.rent_duration_months} month(s)"],
@@ -213,17 +292,7 @@ class ReceiptGenerator:
             colWidths=[150, None],
         )
 
-        payment_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("TEXTCOLOR", (1, -1), (1, -1), colors.green),
-                    ("TEXTCOLOR", (1, 3), (1, 3), status_color),
-                ]
-            )
-        )
+        payment_table.setStyle(_PAYMENT_TS[bool(receipt.fully_paid)])
 
         elements.append(payment_table)
         elements.append(Spacer(1, 20))
@@ -256,4 +325,4 @@ class ReceiptGenerator:
 
         doc.build(elements)
 
-        return file_path
+        return buf.getvalue() if out is None else b""
@@ -1,10 +1,16 @@
-import json
+import asyncio
+import logging
+
+import orjson
 
 import aio_pika
 from aio_pika import ExchangeType, Message
 from .breaker import breaker
 from .settings import settings
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_INTERVAL = 2
 
 
 class RabbitMQConnection:
@@ -12,24 +18,43 @@ class RabbitMQConnection:
         self.url = url
         self.connection = None
         self.channel = None
+        self._exchanges: dict[str, aio_pika.abc.AbstractExchange] = {}
+        self._queues: dict[str, aio_pika.abc.AbstractQueue] = {}
 
-    @retry(
-        stop=stop_after_attempt(5), wait=wait_exponential(multiplier=2, min=2, max=10)
-    )
     async def connect(self):
         try:
             if not self.connection or self.connection.is_closed:
-                print("Connecting to RabbitMQ...")
-                self.connection = await aio_pika.connect_robust(self.url)
+                logger.info("Connecting to RabbitMQ...")
+                self.connection = await aio_pika.connect_robust(
+                    self.url,
+                    reconnect_interval=RECONNECT_INTERVAL,
+                )
                 self.channel = await self.connection.channel()
-                print("Connected to RabbitMQ.")
+                self._exchanges.clear()
+                self._queues.clear()
+                logger.info("Connected to RabbitMQ.")
         except Exception as e:
-            print(f"Failed to connect to RabbitMQ: {e}")
+            logger.error("Failed to connect to RabbitMQ: %s", e)
             raise
 
+    async def _get_exchange(self, name: str) -> aio_pika.abc.AbstractExchange:
+        exchange = self._exchanges.get(name)
+        if exchange is None:
+            exchange = await self.channel.get_exchange(name)
+            self._exchanges[name] = exchange
+        return exchange
+
+    async def _get_queue(self, name: str) -> aio_pika.abc.AbstractQueue:
+        queue = self._queues.get(name)
+        if queue is None:
+            queue = await self.channel.get_queue(name)
+            self._queues[name] = queue
+        return queue
+
     async def declare_queue_with_dlq(self, queue_name: str):
         try:
-            await self.connect()
+            if self.channel is None:
+                await self.connect()
 
             dlx = await self.channel.declare_exchange(
                 settings.RABBITMQ_DLX, ExchangeType.DIRECT
@@ -51,44 +76,73 @@ class RabbitMQConnection:
                 },
             )
             await queue.bind(main_exchange, routing_key=queue_name)
+            self._exchanges[queue_name] = main_exchange
+            self._queues[queue_name] = queue
 
-            print(
-                f"Queue '{queue_name}' declared with DLQ '{settings.RABBITMQ_DLX_QUEUE}'."
+            logger.info(
+                "Queue '%s' declared with DLQ '%s'.",
+                queue_name,
+                settings.RABBITMQ_DLX_QUEUE,
             )
             return main_exchange, queue
 
         except Exception as e:
-            print(f"Failed to declare queue '{queue_name}': {e}")
+            logger.error("Failed to declare queue '%s': %s", queue_name, e)
 
     async def publish_json(self, exchange_name: str, routing_key: str, data: dict):
         async def handler():
             try:
-                await self.connect()
-                exchange = await self.channel.get_exchange(exchange_name)
-                message_body = json.dumps(data).encode()
+                if self.channel is None:
+                    await self.connect()
+                exchange = await self._get_exchange(exchange_name)
+                message_body = orjson.dumps(data)
                 message = Message(body=message_body, content_type="application/json")
                 await exchange.publish(message, routing_key=routing_key)
-                print(f"Published message to {exchange_name}:{routing_key}")
+                logger.debug("Published message to %s:%s", exchange_name, routing_key)
             except Exception as e:
-                print(f"Failed to publish message: {e}")
+                logger.error("Failed to publish message: %s", e)
+
+        await breaker.call(handler)
+
+    async def publish_json_many(
+        self, exchange_name: str, messages: list[tuple[str, dict]]
+    ):
+        async def handler():
+            if self.channel is None:
+                await self.connect()
+            exchange = await self._get_exchange(exchange_name)
+            await asyncio.gather(
+                *(
+                    exchange.publish(
+                        Message(
+                            body=orjson.dumps(data),
+                            content_type="application/json",
+                        ),
+                        routing_key=routing_key,
+                    )
+                    for routing_key, data in messages
+                )
+            )
+            logger.debug("Published %d messages to %s", len(messages), exchange_name)
 
         await breaker.call(handler)
 
     async def consume_json(self, queue_name: str, callback):
         try:
-            await self.connect()
-            queue = await self.channel.get_queue(queue_name)
+            if self.channel is None:
+                await self.connect()
+            queue = await self._get_queue(queue_name)
 
             async with queue.iterator() as queue_iter:
                 async for message in queue_iter:
                     async with message.process():
                         try:
-                            data = json.loads(message.body.decode())
+                            data = orjson.loads(message.body)
                             await callback(data)
                         except Exception as e:
-                            print(f"Error processing message: {e}")
+                            logger.error("Error processing message: %s", e)
         except Exception as e:
-            print(f"Failed to consume messages from '{queue_name}': {e}")
+            logger.error("Failed to consume messages from '%s': %s", queue_name, e)
 
 
 rabbitmq = RabbitMQConnection(settings.RABBITMQ_URL)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import urllib.parse
 import uuid
@@ -10,8 +11,15 @@ from .settings import settings
 
 logger = logging.getLogger(__name__)
 
+DELETE_FLUSH_DELAY = 0.01
+
 
 class RedisIdempotency:
+    _client: httpx.AsyncClient | None = None
+    _client_loop: asyncio.AbstractEventLoop | None = None
+    _pending_deletes: set[str] = set()
+    _delete_task: asyncio.Task | None = None
+
     def __init__(self, namespace: str = "idempotency"):
         redis_url = settings.UPSTASH_REDIS_URL
         if not redis_url:
@@ -28,6 +36,34 @@ class RedisIdempotency:
             "Content-Type": "application/json",
         }
 
+    def _get_client(self) -> httpx.AsyncClient:
+        cls = type(self)
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            cls._client_loop = loop
+            cls._client = httpx.AsyncClient(
+                base_url=self.redis_url,
+                headers=self.headers,
+                http2=True,
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            )
+        return cls._client
+
+    @classmethod
+    async def close(cls):
+        task = cls._delete_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
+        cls._client_loop = None
+
     def _key(self, key: str) -> str:
         return f"{self.namespace}:{key}"
 
@@ -36,54 +72,80 @@ class RedisIdempotency:
             encoded_key = urllib.parse.quote(self._key(key))
             token = uuid.uuid4().hex
 
-            url = f"{self.redis_url}/set/{encoded_key}/{token}?EX={ttl}&NX"
-
-            async with httpx.AsyncClient() as client:
-                res = await client.post(
-                    url,
-                    headers=self.headers,
-                )
+            res = await self._get_client().post(
+                f"/set/{encoded_key}/{token}?EX={ttl}&NX"
+            )
 
-                if res.status_code == 200 and res.json().get("result") == "OK":
+            if res.status_code == 200:
+                result = res.json().get("result")
+                if result == "OK":
                     return True
-
-                if res.status_code == 200 and res.json().get("result") is None:
+                if result is None:
                     return False
 
-                raise ConnectionError(f"Redis SET NX failed ({res.status_code})")
+            raise ConnectionError(f"Redis SET NX failed ({res.status_code})")
 
         return await breaker.call(handler)
 
+    async def _post_status(self, url: str, **kwargs) -> int:
+        async with self._get_client().stream("POST", url, **kwargs) as res:
+            return res.status_code
+
     async def delete(self, key: str) -> bool:
         async def handler():
             encoded_key = urllib.parse.quote(self._key(key))
 
-            url = f"{self.redis_url}/del/{encoded_key}"
-
-            async with httpx.AsyncClient() as client:
-                res = await client.post(
-                    url,
-                    headers=self.headers,
-                )
+            status_code = await self._post_status(f"/del/{encoded_key}")
 
-                if res.status_code == 200:
-                    return True
+            if status_code == 200:
+                return True
 
-                raise ConnectionError(f"Redis DEL failed ({res.status_code})")
+            raise ConnectionError(f"Redis DEL failed ({status_code})")
 
         return await breaker.call(handler)
 
+    async def _pipeline(self, commands: list[list[str]]):
+        status_code = await self._post_status("/pipeline", json=commands)
+        if status_code != 200:
+            raise ConnectionError(f"Redis pipeline failed ({status_code})")
+
+    def _schedule_delete(self, key: str):
+        cls = type(self)
+        cls._pending_deletes.add(self._key(key))
+        if cls._delete_task is None or cls._delete_task.done():
+            cls._delete_task = asyncio.create_task(self._flush_deletes())
+
+    async def _send_pending_deletes(self):
+        cls = type(self)
+        keys = list(cls._pending_deletes)
+        cls._pending_deletes.clear()
+        try:
+            await self._pipeline([["DEL", *keys]])
+        except Exception:
+            logger.exception("Failed to release %d idempotency keys", len(keys))
+
+    async def _flush_deletes(self):
+        cls = type(self)
+        try:
+            while cls._pending_deletes:
+                await asyncio.sleep(DELETE_FLUSH_DELAY)
+                await self._send_pending_deletes()
+        except asyncio.CancelledError:
+            if cls._pending_deletes:
+                await self._send_pending_deletes()
+            raise
+
     async def run_once(
         self,
         key: str,
         coro: Callable[[], Awaitable],
         ttl: int = 30,
     ):
-        try:
-            acquired = await self.acquire(key, ttl)
-            if not acquired:
-                raise RuntimeError("Duplicate request in progress or already processed")
+        acquired = await self.acquire(key, ttl)
+        if not acquired:
+            raise RuntimeError("Duplicate request in progress or already processed")
 
+        try:
             return await coro()
         finally:
-            await self.delete(key)
+            self._schedule_delete(key)
@@ -10,18 +10,23 @@ logger = logging.getLogger(__name__)
 
 
 
+def _find_request(args, kwargs) -> Request | None:
+    request = kwargs.get("request")
+    if isinstance(request, Request):
+        return request
+    for arg in args:
+        if isinstance(arg, Request):
+            return arg
+    return None
+
+
 def safe_handler(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        request: Request | None = None
-        for arg in list(args) + list(kwargs.values()):
-            if isinstance(arg, Request):
-                request = arg
-                break
-
         try:
             return await func(*args, **kwargs)
         except HTTPException as e:
+            request = _find_request(args, kwargs)
             if request:
                 client_ip = request.client.host if request.client else "unknown"
                 path = request.url.path
@@ -32,6 +37,7 @@ def safe_handler(func):
                 )
             raise
         except Exception as e:
+            request = _find_request(args, kwargs)
             if request:
                 client_ip = request.client.host if request.client else "unknown"
                 path = request.url.path
@@ -2,13 +2,26 @@ import hashlib
 from core.settings import settings
 from fastapi import HTTPException
 
+_SECRET = settings.SECRET_KEY.encode() if settings.SECRET_KEY else None
+
+
+def _blake2b_key(secret: bytes) -> bytes:
+    if len(secret) <= hashlib.blake2b.MAX_KEY_SIZE:
+        return secret
+    return hashlib.blake2b(secret).digest()
+
+
+_BASE_BLAKE = (
+    hashlib.blake2b(key=_blake2b_key(_SECRET), digest_size=32) if _SECRET else None
+)
+
 
 class SensitiveHash:
     @staticmethod
-    async def hash_nin(nin: str) -> str:
-        if not settings.SECRET_KEY:
+    def hash_nin(nin: str) -> str:
+        if _BASE_BLAKE is None:
             raise HTTPException(404, "Secret key Not Found")
 
-        normalized = nin.strip().encode()
-        salted = settings.SECRET_KEY.encode() + normalized
-        return hashlib.sha256(salted).hexdigest()
+        digest = _BASE_BLAKE.copy()
+        digest.update(nin.strip().encode())
+        return digest.hexdigest()
@@ -1,29 +1,39 @@
 import os
 from datetime import datetime, timedelta, timezone
-from typing import ClassVar, List
+from functools import cached_property
+from typing import ClassVar
 
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from .url_parser import parser
 
 load_dotenv()
 
 
+def _redis_url(prefix: str) -> str | None:
+    url = os.getenv(f"{prefix}_URL")
+    if url:
+        return url
+    host = os.getenv(f"{prefix}_HOST")
+    if not host:
+        return None
+    return (
+        f"redis://{os.getenv(f'{prefix}_USERNAME')}:{os.getenv(f'{prefix}_PASSWORD')}"
+        f"@{host}:{os.getenv(f'{prefix}_PORT')}/0"
+    )
+
+
 class Settings(BaseSettings):
     FLUTTERWAVE_BASE_URL: str = "https://api.flutterwave.com/v3"
     PAYSTACK_BASE_URL: str = "https://api.paystack.co"
     REDIRECT_URL: str | None = os.getenv("REDIRECT_URL")
     DATABASE_URL: str | None = os.getenv("DATABASE_URL")
     RENDER_DATABASE_URL: str | None = os.getenv("RENDER_DATABASE_URL")
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 500  # set to 0 behind pgbouncer transaction mode
     PROJECT_NAME: str = "REAL ESTATE MANAGEMENT And SALES SYSTEM"
-    RATE_LIMIT_REDIS_URL: str = (
-        f"redis://{os.getenv('RATE_LIMIT_REDIS_USERNAME')}:{os.getenv('RATE_LIMIT_REDIS_PASSWORD')}"
-        f"@{os.getenv('RATE_LIMIT_REDIS_HOST')}:{os.getenv('RATE_LIMIT_REDIS_PORT')}/0"
-    )
-    CELERY_REDIS_URL: str | None = (
-        f"redis://{os.getenv('CELERY_REDIS_USERNAME')}:{os.getenv('CELERY_REDIS_PASSWORD')}"
-        f"@{os.getenv('CELERY_REDIS_HOST')}:{os.getenv('CELERY_REDIS_PORT')}/0"
-    )
     RABBITMQ_MAIN_EXCHANGE: str = "location_events"
     RABBITMQ_URL: str = os.getenv("RABBITMQ_URL", "")
     RABBITMQ_DLX: str = "dead_letter_exchange"
@@ -67,19 +77,10 @@ class Settings(BaseSettings):
     CSRF_TOKEN_EXPIRE_DAYS: int = 5
     SECURE_COOKIES: bool = False  # must be false on localhost
     SECRET_KEY: str | None = os.getenv("SECRET_KEY")
-    jwt_expiration: ClassVar[datetime] = datetime.now(timezone.utc) + timedelta(hours=1)
-    access_key_jwt_expiration: ClassVar[datetime] = datetime.now(
-        timezone.utc
-    ) + timedelta(minutes=10)
-    refresh_expiration_jwt_expiration: ClassVar[datetime] = datetime.now(
-        timezone.utc
-    ) + timedelta(days=5)
 
     MAX_RESENDS: int = 3
+    ADMIN_BCRYPT_ROUNDS: int = 12  # lower only for local/dev bootstrap
     LOCK_DURATION: ClassVar[timedelta] = timedelta(hours=2)
-    csrf_token_expiration: ClassVar[datetime] = datetime.now(timezone.utc) + timedelta(
-        days=5
-    )
     CRITICAL_SERVICE_RAW: str = os.getenv("CRITICAL_SERVICE_URLS", "")
     RESEND_API_KEY: str | None = os.getenv("RESEND_API_KEY")
     RESEND_SENDER: str | None = os.getenv("RESEND_SENDER")
@@ -88,21 +89,39 @@ class Settings(BaseSettings):
     ADMIN_REDIS_URL: str | None = os.getenv("ADMIN_REDIS_URL")
     ALLOWED_HOSTS_RAW: str = os.getenv("ALLOWED_HOSTS", "")
 
-    @property
-    def ALLOWED_HOSTS(self) -> List[str]:
+    @cached_property
+    def RATE_LIMIT_REDIS_URL(self) -> str | None:
+        return _redis_url("RATE_LIMIT_REDIS")
+
+    @cached_property
+    def CELERY_REDIS_URL(self) -> str | None:
+        return _redis_url("CELERY_REDIS")
+
+    @cached_property
+    def ALLOWED_HOSTS(self) -> tuple[str, ...]:
         return parser.parse_url_list(self.ALLOWED_HOSTS_RAW, "ALLOWED_HOSTS")
 
-    @property
-    def CRITICAL_SERVICE_URLS(self) -> List[str]:
+    @cached_property
+    def CRITICAL_SERVICE_URLS(self) -> tuple[str, ...]:
         return parser.parse_url_list(
             self.CRITICAL_SERVICE_RAW,
             "CRITICAL_SERVICE_URLS",
         )
 
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
-        case_sensitive = False
+    def access_token_expiry(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(
+            minutes=self.ACCESS_EXPIRE_MINUTES
+        )
+
+    def refresh_token_expiry(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(days=self.REFRESH_EXPIRE_DAYS)
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+        env_file=".env",
+        extra="ignore",
+        case_sensitive=False,
+    )
 
 
 settings = Settings()
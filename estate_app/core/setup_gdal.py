@@ -1,6 +1,9 @@
+import logging
 import os
 import platform
 
+logger = logging.getLogger(__name__)
+
 
 def setup_gdal():
     system = platform.system()
@@ -9,13 +12,13 @@ def setup_gdal():
         gdal_dll = os.environ.get("GDAL_LIBRARY_PATH", r"C:\OSGeo4W\bin\gdal311.dll")
 
         if not os.path.exists(gdal_dll):
-            print(" GDAL not found at expected path:", gdal_dll)
+            logger.warning("GDAL not found at expected path: %s", gdal_dll)
         else:
             os.environ["OSGEO4W_ROOT"] = OSGEO4W
             os.environ["GDAL_DATA"] = OSGEO4W + r"\share\gdal"
             os.environ["PROJ_LIB"] = OSGEO4W + r"\share\proj"
             os.environ["PATH"] = OSGEO4W + r"\bin;" + os.environ["PATH"]
             os.environ["GDAL_LIBRARY_PATH"] = gdal_dll
-            print("GDAL configured for Windows at:", gdal_dll)
+            logger.info("GDAL configured for Windows at: %s", gdal_dll)
     else:
-        print("GDAL available system-wide (Linux).")
\ No newline at end of file
+        logger.info("GDAL available system-wide (Linux).")
\ No newline at end of file
@@ -1,9 +1,31 @@
 import asyncio
+import atexit
+import os
 from concurrent.futures import ThreadPoolExecutor
 
-executor = ThreadPoolExecutor(max_workers=5)
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="estate-io"
+        )
+    return _executor
+
+
+def _shutdown_executor():
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+
+
+atexit.register(_shutdown_executor)
 
 
 async def run_in_thread(func, *args):
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(executor, func, *args)
\ No newline at end of file
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_executor(), func, *args
+    )
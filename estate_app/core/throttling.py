@@ -1,10 +1,14 @@
+import logging
+
 from redis.asyncio import from_url
 from .settings import settings
 from fastapi import Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi_limiter import FastAPILimiter
 from fastapi_limiter.depends import RateLimiter
 
+logger = logging.getLogger(__name__)
+
 
 class RateLimitManager:
     def __init__(self):
@@ -18,39 +22,32 @@ class RateLimitManager:
                 decode_responses=True,
             )
             await FastAPILimiter.init(self.redis)
-            print("Rate limiter initialized successfully (Redis Cloud).")
+            logger.info("Rate limiter initialized successfully (Redis Cloud).")
         except Exception as e:
-            print(f"Rate limiter initialization failed: {e}")
+            logger.error("Rate limiter initialization failed: %s", e)
 
     @staticmethod
     async def limit_exceeded_handler(request: Request, exc):
         try:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={"detail": "Limit exceeded. Please try again later."},
             )
-        except Exception as e:
-            print(f"Error in limit_exceeded_handler: {e}")
-            return JSONResponse(
+        except Exception:
+            logger.exception("Error in limit_exceeded_handler")
+            return ORJSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error."},
             )
 
     async def user_or_ip(self, request: Request) -> str:
-        try:
-            user = getattr(request.state, "user", None)
-            user_id = getattr(user, "id", None)
+        rate_limit_id = getattr(request.state, "rate_limit_id", None)
+        if rate_limit_id:
+            return rate_limit_id
 
-            if user_id is not None:
-                return f"user:{str(user_id)}"
-        except Exception:
-            pass
-
-        try:
-            if request.client and request.client.host:
-                return f"ip:{request.client.host}"
-        except Exception:
-            pass
+        client = request.client
+        if client and client.host:
+            return f"ip:{client.host}"
 
         return "anonymous"
 
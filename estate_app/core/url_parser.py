@@ -1,16 +1,18 @@
-from typing import List
+import logging
 
+logger = logging.getLogger(__name__)
+
+URL_SCHEMES = ("http://", "https://")
 
-class URLParser:
-    def parse_url_list(self, raw_value: str, name: str) -> List[str]:
-        items = [v.strip() for v in raw_value.split(",") if v.strip()]
 
-        valid_items = [
-            v for v in items if v.startswith("http://") or v.startswith("https://")
-        ]
+class URLParser:
+    def parse_url_list(self, raw_value: str, name: str) -> tuple[str, ...]:
+        valid_items = tuple(
+            v for v in map(str.strip, raw_value.split(",")) if v.startswith(URL_SCHEMES)
+        )
 
         if not valid_items:
-            print(f"WARNING: No valid URLs found in {name}")
+            logger.warning("No valid URLs found in %s", name)
 
         return valid_items
 
@@ -1,29 +1,34 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Type, TypeVar
 
 E = TypeVar("E", bound=Enum)
 
+
+@lru_cache(maxsize=None)
+def _index(enum_cls: Type[Enum]) -> tuple[dict, dict, str]:
+    allowed = ", ".join(e.value for e in enum_cls)
+    return dict(enum_cls._value2member_map_), dict(enum_cls.__members__), allowed
+
+
 def validate_enum(
     value: str | Enum,
     enum_cls: Type[E],
     *,
     field: str,
 ) -> E:
-    if isinstance(value, enum_cls):
+    if type(value) is enum_cls:
         return value
 
-    if isinstance(value, str):
-        try:
-            return enum_cls(value)
-        except ValueError:
-            pass
+    value_map, name_map, allowed = _index(enum_cls)
 
-        try:
-            return enum_cls[value]
-        except KeyError:
-            pass
+    if isinstance(value, str):
+        hit = value_map.get(value)
+        if hit is None:
+            hit = name_map.get(value)
+        if hit is not None:
+            return hit
 
-    allowed = ", ".join(e.value for e in enum_cls)
     raise ValueError(
         f"Invalid {field}: {value}. Allowed values: {allowed}"
     )
@@ -1,46 +1,50 @@
+import hmac
 import uuid
+from functools import lru_cache
 
 import jwt
-from jose import jwt as websocket_jwt, JWTError
 from fastapi import HTTPException, Request, status, WebSocket
 
 from .settings import settings
 
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHMS = [settings.ALGORITHM]
+DECODE_OPTIONS = {"require": ["sub", "exp"]}
+_DOC_PATHS = frozenset({"/docs", "/openapi.json", "/redoc"})
 
-def decode_ws_access_token(token: str) -> uuid.UUID:
-    try:
-        payload = websocket_jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
 
-        user_id = payload.get("sub")
-        if not user_id:
-            raise ValueError("Token missing user ID")
+@lru_cache(maxsize=8192)
+def _parse_user_id(user_id: str) -> uuid.UUID:
+    return uuid.UUID(user_id)
 
-        return uuid.UUID(user_id)
 
-    except JWTError:
+def _decode(token: str) -> uuid.UUID:
+    payload = jwt.decode(
+        token,
+        SECRET_KEY,
+        algorithms=ALGORITHMS,
+        options=DECODE_OPTIONS,
+    )
+    return _parse_user_id(payload["sub"])
+
+
+def decode_ws_access_token(token: str) -> uuid.UUID:
+    try:
+        return _decode(token)
+    except jwt.InvalidTokenError:
         raise ValueError("Invalid or expired token")
 
 
 def decode_http_access_token(token: str) -> uuid.UUID:
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
+    return _decode(token)
 
-        user_id = payload.get("sub")
-        if not user_id:
-            raise ValueError("Token missing user ID")
 
-        return uuid.UUID(user_id)
+def _is_docs_path(path: str) -> bool:
+    return path in _DOC_PATHS or path.startswith("/docs")
 
-    except JWTError:
-        raise ValueError("Invalid or expired token")
+
+def _tokens_match(first: str, second: str) -> bool:
+    return hmac.compare_digest(first.encode(), second.encode())
 
 
 async def validate_csrf(request: Request):
@@ -62,7 +66,7 @@ async def validate_csrf(request: Request):
         #         detail="CSRF token mismatch (header vs cookie)",
         #     )
 
-        if session_token != cookie_token:
+        if not _tokens_match(session_token, cookie_token):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Invalid CSRF token: mismatch with session token.",
@@ -84,7 +88,7 @@ async def validate_csrf_ws(websocket: WebSocket):
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return False
 
-    if cookie_token != query_token:
+    if not _tokens_match(cookie_token, query_token):
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return False
 
@@ -93,9 +97,7 @@ async def validate_csrf_ws(websocket: WebSocket):
 
 async def validate_csrf_dependency(request: Request):
     try:
-        if any(
-            path in str(request.url) for path in ["/docs", "/openapi.json", "/redoc"]
-        ):
+        if _is_docs_path(request.url.path):
             return
         await validate_csrf(request)
     except Exception as e:
@@ -104,36 +106,27 @@ async def validate_csrf_dependency(request: Request):
 
 async def validate_csrf_dependency_ws(websocket: WebSocket):
     try:
-        if any(
-            path in str(websocket.url) for path in ["/docs", "/openapi.json", "/redoc"]
-        ):
+        if _is_docs_path(websocket.url.path):
             return
         await validate_csrf_ws(websocket)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def jwt_protect(request: Request) -> uuid.UUID:
+async def _jwt_protect_impl(request: Request) -> uuid.UUID:
     token = request.cookies.get("access_token")
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
         return decode_http_access_token(token)
-
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    except jwt.PyJWTError as e:
+        detail = (
+            "Token expired"
+            if isinstance(e, jwt.ExpiredSignatureError)
+            else "Invalid token"
+        )
+        raise HTTPException(status_code=401, detail=detail)
 
 
-async def passkey_jwt_protect(request: Request) -> uuid.UUID:
-    token = request.cookies.get("access_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    try:
-        return decode_http_access_token(token)
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+jwt_protect = passkey_jwt_protect = _jwt_protect_impl
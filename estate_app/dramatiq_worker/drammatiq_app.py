@@ -1,3 +1,5 @@
+import logging
+
 import dramatiq
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -30,6 +32,8 @@ from drammtiq_tasks.rent_notifications import create_rent_notification_task
 from drammtiq_tasks.update_bank_codes_tasks import update_bank_code_task
 from drammtiq_tasks.youverify_nin_tasks import create_youverify_nin_task
 
+logger = logging.getLogger(__name__)
+
 
 class DramatiqManager:
     def __init__(self):
@@ -50,6 +54,7 @@ class DramatiqManager:
         dramatiq.set_broker(self.broker)
 
         self._register_tasks()
+        self._actors = dict(self.broker.actors)
 
         self.scheduler = BackgroundScheduler(timezone="UTC")
         self._register_cron_jobs()
@@ -80,30 +85,45 @@ class DramatiqManager:
         """
 
         self.scheduler.add_job(
-            func=lambda: self.broker.get_actor("expire_pending_viewings").send(),
+            func=self._bulk_send,
+            args=[
+                [
+                    "expire_pending_rental_viewings",
+                    "expire_pending_sales_viewings",
+                ]
+            ],
             trigger=CronTrigger(minute=0),
             id="expire-pending-viewings-hourly",
             replace_existing=True,
+            coalesce=True,
+            max_instances=1,
         )
 
         self.scheduler.add_job(
-            func=lambda: self.broker.get_actor("process_rent_notifications").send(),
+            func=self._bulk_send,
+            args=[["process_rent_notifications"]],
             trigger=CronTrigger(hour=1, minute=0),
             id="process-rent-notifications-daily",
             replace_existing=True,
+            coalesce=True,
+            max_instances=1,
         )
 
+    def _bulk_send(self, actor_names: list[str]):
+        messages = [self._actors[name].message() for name in actor_names]
+        for message in messages:
+            self.broker.enqueue(message)
+
     async def connect(self):
-        print(f"Connecting to Dramatiq broker: {self.REDIS_URL}")
+        logger.info("Connecting to Dramatiq broker...")
         try:
             self.broker.client.ping()
-            print("Dramatiq connected successfully.")
+            logger.info("Dramatiq connected successfully.")
         except Exception as e:
-            print("Dramatiq connection failed:", e)
+            logger.error("Dramatiq connection failed: %s", e)
 
     def delay(self, actor_name: str, *args, **kwargs):
-        actor = self.broker.get_actor(actor_name)
-        return actor.send(*args, **kwargs)
+        return self._actors[actor_name].send(*args, **kwargs)
 
 
 dramatiq_app = DramatiqManager()
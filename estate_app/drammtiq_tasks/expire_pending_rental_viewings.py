@@ -6,6 +6,7 @@ from services.expire_pending_conversation import ExpirePendingConverstaion
 
 def create_rental_viewing_expiry_task():
     @dramatiq.actor(
+        actor_name="expire_pending_rental_viewings",
         queue_name="expire_pending_rental_viewings",
         max_retries=3,
         time_limit=600_000,
@@ -6,6 +6,7 @@ from services.expire_pending_conversation import ExpirePendingConverstaion
 
 def create_sales_viewing_expiry_task():
     @dramatiq.actor(
+        actor_name="expire_pending_sales_viewings",
         queue_name="expire_pending_sales_viewings",
         max_retries=3,
         time_limit=600_000,
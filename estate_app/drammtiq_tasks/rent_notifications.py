@@ -8,6 +8,7 @@ from services.rent_service import RentService
 
 def create_rent_notification_task():
     @dramatiq.actor(
+        actor_name="process_rent_notifications",
         queue_name="process_rent_notifications",
         max_retries=3,
         time_limit=600_000,
@@ -6,16 +6,16 @@ from dateutil.relativedelta import relativedelta
 from .enums import RentCycle
 
 
-def calculate_expiry(start_date: date, rent_cycle: str) -> date:
-    cycle = (rent_cycle or "").strip().lower()
-
-    if cycle == RentCycle.MONTHLY.value.lower():
-        return start_date + relativedelta(months=1)
+_CYCLE_DELTAS = {
+    RentCycle.MONTHLY.value.lower(): relativedelta(months=1),
+    RentCycle.YEARLY.value.lower(): relativedelta(years=1),
+}
+_MONTH = _CYCLE_DELTAS[RentCycle.MONTHLY.value.lower()]
 
-    if cycle == RentCycle.YEARLY.value.lower():
-        return start_date + relativedelta(years=1)
 
-    return start_date + relativedelta(months=1)
+def calculate_expiry(start_date: date, rent_cycle: str) -> date:
+    cycle = (rent_cycle or "").strip().lower()
+    return start_date + _CYCLE_DELTAS.get(cycle, _MONTH)
 
 
 def slugify(value: str) -> str:
@@ -106,6 +106,19 @@ class AuthRepo:
             await self.db.rollback()
             raise
 
+    async def blacklist_tokens(self, tokens: list[str]):
+        if not tokens:
+            return
+        stmt = insert(BlacklistedToken).on_conflict_do_nothing(
+            index_elements=["token"]
+        )
+        try:
+            await self.db.execute(stmt, [{"token": token} for token in tokens])
+            await self.db.commit()
+        except SQLAlchemyError:
+            await self.db.rollback()
+            raise
+
     async def is_token_blacklisted(self, token: str) -> bool:
         result = await self.db.execute(
             select(BlacklistedToken).where(BlacklistedToken.token == token)
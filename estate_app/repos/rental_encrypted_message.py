@@ -50,6 +50,8 @@ class RentalEncryptedMessageRepository:
         self,
         conversation_id: UUID,
         user_id: UUID,
+        page: int = 1,
+        per_page: int = 20,
     ):
         stmt = (
             select(RentalEncryptedMessage)
@@ -69,6 +71,8 @@ class RentalEncryptedMessageRepository:
                 ),
             )
             .order_by(RentalEncryptedMessage.created_at)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
         )
 
         result = await self.db.execute(stmt)
@@ -50,6 +50,8 @@ class SaleEncryptedMessageRepository:
         self,
         conversation_id: UUID,
         user_id: UUID,
+        page: int = 1,
+        per_page: int = 20,
     ):
         stmt = (
             select(SaleEncryptedMessage)
@@ -69,6 +71,8 @@ class SaleEncryptedMessageRepository:
                 ),
             )
             .order_by(SaleEncryptedMessage.created_at)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
         )
 
         result = await self.db.execute(stmt)
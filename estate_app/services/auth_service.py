@@ -23,11 +23,6 @@ ALGORITHM = settings.ALGORITHM
 ACCESS_EXPIRE_MINUTES = settings.ACCESS_EXPIRE_MINUTES
 REFRESH_EXPIRE_DAYS = settings.REFRESH_EXPIRE_DAYS
 SECURE_COOKIES = settings.SECURE_COOKIES
-access_exp = datetime.now(timezone.utc) + timedelta(
-    minutes=settings.ACCESS_EXPIRE_MINUTES
-)
-
-refresh_exp = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_EXPIRE_DAYS)
 
 
 class AuthService:
@@ -118,12 +113,20 @@ class AuthService:
             #     )
 
             access_token = jwt.encode(
-                {"sub": str(user.id), "type": "access", "exp": access_exp},
+                {
+                    "sub": str(user.id),
+                    "type": "access",
+                    "exp": settings.access_token_expiry(),
+                },
                 SECRET_KEY,
                 algorithm=ALGORITHM,
             )
             refresh_token = jwt.encode(
-                {"sub": str(user.id), "type": "refresh", "exp": refresh_exp},
+                {
+                    "sub": str(user.id),
+                    "type": "refresh",
+                    "exp": settings.refresh_token_expiry(),
+                },
                 SECRET_KEY,
                 algorithm=ALGORITHM,
             )
@@ -73,16 +73,15 @@ class BankService:
         cached = await cache.get_json(cache_key)
         if cached:
             return self.mapper.many(items=cached, schema=BankOut)
-        listings = await self.repo.get_banks()
+        listings = await self.repo.get_banks(page=page, per_page=per_page)
         listings_out = self.mapper.many(items=listings, schema=BankOut)
-        paginated = self.paginate.paginate(listings_out, page, per_page)
 
         await cache.set_json(
             cache_key,
-            self.paginate.get_list_json_dumps(paginated),
+            self.paginate.get_list_json_dumps(listings_out),
             ttl=300,
         )
-        return paginated
+        return listings_out
 
     async def get_all_banks(
         self,
@@ -1,6 +1,4 @@
 import uuid
-from pathlib import Path
-from typing import Optional
 
 from core.cloudinary_setup import cloudinary_client
 from core.pdf_generate import ReceiptGenerator
@@ -34,8 +32,6 @@ class GenerateReceiptPDF:
         if not receipt:
             raise ValueError("Receipt disappeared after lock")
 
-        pdf_path: Optional[Path] = None
-
         try:
             if not settings.SECRET_KEY:
                 raise ValueError("SECRET_KEY is not configured")
@@ -44,10 +40,10 @@ class GenerateReceiptPDF:
                     value=f"{receipt.id}:{receipt.amount}",
                     secret=settings.SECRET_KEY,
                 )
-            pdf_path = ReceiptGenerator.generate_pdf(receipt)
+            pdf_bytes = ReceiptGenerator.generate_pdf(receipt)
 
             upload_result = await cloudinary_client.upload_pdf_with_signature(
-                pdf_path,
+                pdf_bytes,
                 public_id=receipt.public_id,
                 folder="receipts",
             )
@@ -69,10 +65,3 @@ class GenerateReceiptPDF:
             )
             await self.repo.db_commit()
             raise
-
-        finally:
-            if pdf_path and pdf_path.exists():
-                try:
-                    pdf_path.unlink()
-                except Exception:
-                    pass
@@ -117,7 +117,9 @@ class LetterService:
             if not tenant.matched_user_verified:
                 raise HTTPException(400, "Tenant not matched yet")
 
-            file_hash = await self.compute.compute_file_hash(file_url=data.file_url)
+            file_hash = await self.compute.compute_file_hash_async(
+                file_url=data.file_url
+            )
             existing = await self.repo.get_by_hash(
                 property_id=property_id, file_hash=file_hash
             )
@@ -177,7 +179,9 @@ class LetterService:
                 return []
 
             managed_by_id = await self.get_managed_by_id(property=property)
-            file_hash = await self.compute.compute_file_hash(file_url=data.file_url)
+            file_hash = await self.compute.compute_file_hash_async(
+                file_url=data.file_url
+            )
             existing = await self.repo.get_by_hash(
                 property_id=property_id, file_hash=file_hash
             )
@@ -271,17 +275,20 @@ class LetterService:
             print(f"Cached:::{cached}")
             if cached:
                 return self.mapper.many(items=cached, schema=LetterSchemaOut)
-            props = await self.repo.get_all_landlord_letters(user_id=user_id)
+            props = await self.repo.get_all_landlord_letters(
+                user_id=user_id,
+                page=page,
+                per_page=per_page,
+            )
             if not props:
                 return []
             props_dicts = self.mapper.many(items=props, schema=LetterSchemaOut)
-            paginated_props = self.paginate.paginate(props_dicts, page, per_page)
             await self.cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=props_dicts),
                 ttl=300,
             )
-            return paginated_props
+            return props_dicts
 
         return await self.breaker.call(handler)
 
@@ -302,18 +309,20 @@ class LetterService:
             if cached:
                 return self.mapper.many(items=cached, schema=LetterSchemaOut)
             props = await self.repo.get_all_properties_letters(
-                user_id=user_id, property_id=property_id
+                user_id=user_id,
+                property_id=property_id,
+                page=page,
+                per_page=per_page,
             )
             if not props:
                 return []
             props_dicts = self.mapper.many(items=props, schema=LetterSchemaOut)
-            paginated_props = self.paginate.paginate(props_dicts, page, per_page)
             await self.cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=props_dicts),
                 ttl=300,
             )
-            return paginated_props
+            return props_dicts
 
         return await self.breaker.call(handler)
 
@@ -434,16 +443,19 @@ class LetterService:
 
             if cached:
                 return self.mapper.many(items=cached, schema=LetterRecipientOut)
-            props = await self.repo.get_all_tenant_letters(tenant_id=tenant_id)
+            props = await self.repo.get_all_tenant_letters(
+                tenant_id=tenant_id,
+                page=page,
+                per_page=per_page,
+            )
             if not props:
                 return []
             props_dicts = self.mapper.many(items=props, schema=LetterRecipientOut)
-            paginated_props = self.paginate.paginate(props_dicts, page, per_page)
             await self.cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=props_dicts),
                 ttl=300,
             )
-            return paginated_props
+            return props_dicts
 
         return await self.breaker.call(handler)
@@ -72,13 +72,12 @@ class LGAService:
             if cached:
                 return cached
 
-            lgas = await self.repo.get_all()
+            lgas = await self.repo.get_all(page=page, per_page=per_page)
             lga_dicts = [l.to_dict() for l in lgas]
             if not lga_dicts:
                 return []
-            paginated_lgas = self.paginate.paginate(lga_dicts, page, per_page)
-            await cache.set_json(cache_key, paginated_lgas, ttl=300)
-            return paginated_lgas
+            await cache.set_json(cache_key, lga_dicts, ttl=300)
+            return lga_dicts
 
         return await breaker.call(handler)
 
@@ -92,11 +91,10 @@ class LGAService:
             if cached:
                 return cached
 
-            lgas = await self.repo.get_all_with_state()
+            lgas = await self.repo.get_all_with_state(page=page, per_page=per_page)
             lga_dicts = [l.to_dict() for l in lgas]
-            paginated_lgas = self.paginate.paginate(lga_dicts, page, per_page)
-            await cache.set_json(cache_key, paginated_lgas, ttl=300)
-            return paginated_lgas
+            await cache.set_json(cache_key, lga_dicts, ttl=300)
+            return lga_dicts
 
         return await breaker.call(handler)
 
@@ -35,8 +35,6 @@ ALGORITHM = settings.ALGORITHM
 ACCESS_EXPIRE_MINUTES = settings.ACCESS_EXPIRE_MINUTES
 REFRESH_EXPIRE_DAYS = settings.REFRESH_EXPIRE_DAYS
 SECURE_COOKIES = settings.SECURE_COOKIES
-access_exp = settings.access_key_jwt_expiration
-refresh_exp = settings.refresh_expiration_jwt_expiration
 
 
 class PasskeyService:
@@ -279,13 +277,21 @@ class PasskeyService:
                 raise HTTPException(404, "User not found")
 
             access_token = jwt.encode(
-                {"sub": str(user.id), "type": "access", "exp": access_exp},
+                {
+                    "sub": str(user.id),
+                    "type": "access",
+                    "exp": settings.access_token_expiry(),
+                },
                 SECRET_KEY,
                 algorithm=ALGORITHM,
             )
 
             refresh_token = jwt.encode(
-                {"sub": str(user.id), "type": "refresh", "exp": refresh_exp},
+                {
+                    "sub": str(user.id),
+                    "type": "refresh",
+                    "exp": settings.refresh_token_expiry(),
+                },
                 SECRET_KEY,
                 algorithm=ALGORITHM,
             )
@@ -376,21 +382,24 @@ class PasskeyService:
             cached = await self.cache.get_json(cache_key)
             if cached is not None:
                 return self.mapper.many(items=cached, schema=CredentialAttestationOut)
-            passkey = await self.repo.get_all_passkeys_for_user(user_id=current_user.id)
+            passkey = await self.repo.get_all_passkeys_for_user(
+                user_id=current_user.id,
+                page=page,
+                per_page=per_page,
+            )
             if not passkey:
                 return []
             passkey_dict = self.mapper.many(passkey, CredentialAttestationOut)
-            paginated_props = self.paginate.paginate(passkey_dict, page, per_page)
             await self.cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=passkey_dict),
                 ttl=300,
             )
             return {
                 "page": page,
                 "per_page": per_page,
                 "total": len(passkey),
-                "items": paginated_props,
+                "items": passkey_dict,
             }
 
         return await breaker.call(handler)
@@ -113,7 +113,7 @@ class UserProfileService:
                     detail="Profile picture already exists. Use update instead.",
                 )
 
-            profile_pic_hash = await self.compute.compute_file_hash(
+            profile_pic_hash = await self.compute.compute_file_hash_async(
                 data.profile_pic_path,
             )
 
@@ -236,7 +236,7 @@ class UserProfileService:
                 raise HTTPException(status_code=404, detail="Profile not found")
             old_public_id = profile.public_id
 
-            new_hash = await self.compute.compute_file_hash(
+            new_hash = await self.compute.compute_file_hash_async(
                 data.profile_pic_path,
             )
 
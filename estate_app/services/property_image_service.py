@@ -57,15 +57,18 @@ class PropertyImageService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return self.mapper.many(items=cached, schema=BaseImageOut)
-            images = await self.repo.get_all(property_id=property_id)
+            images = await self.repo.get_all(
+                property_id=property_id,
+                page=page,
+                per_page=per_page,
+            )
             images_out = self.mapper.many(items=images, schema=BaseImageOut)
-            paginated_images = self.paginate.paginate(images_out, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_images),
+                self.paginate.get_list_json_dumps(images_out),
                 ttl=300,
             )
-            return paginated_images
+            return images_out
 
         return await breaker.call(handler)
 
@@ -85,7 +88,7 @@ class PropertyImageService:
                 raise HTTPException(
                     status_code=400, detail="Maximum of 3 images allowed per listing."
                 )
-            image_hash = await self.compute.compute_file_hash(file_url=image_url)
+            image_hash = await self.compute.compute_file_hash_async(file_url=image_url)
             existing = await self.repo.get_by_hash(
                 property_id=property_id, image_hash=image_hash
             )
@@ -157,7 +160,7 @@ class PropertyImageService:
                     detail="You cannot update an image you didn't create",
                 )
 
-            new_hash = await self.compute.compute_file_hash(secure_url)
+            new_hash = await self.compute.compute_file_hash_async(secure_url)
 
             existing = await self.repo.get_by_hash(old_image.property_id, new_hash)
             if existing and existing.id != image_id:
@@ -199,9 +202,9 @@ class PropertyImageService:
                     status_code=403,
                     detail="You cannot delete an image you didn't create",
                 )
-            token = await self.token_delete.generate_token(image_id=str(image.id))
+            token = self.token_delete.generate_token(image_id=str(image.id))
 
-            validated_token = await self.token_delete.validate_token(
+            validated_token = self.token_delete.validate_token(
                 image_id=str(image.id), token=token
             )
 
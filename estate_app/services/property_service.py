@@ -249,16 +249,18 @@ class PropertyService:
             if cached:
                 return self.mapper.many(items=cached, schema=PropertyOut)
             props = await self.repo.get_properties_by_state_user(
-                state_id=state_id, user_id=user_id
+                state_id=state_id,
+                user_id=user_id,
+                page=page,
+                per_page=per_page,
             )
             props_dicts = self.mapper.many(items=props, schema=PropertyOut)
-            paginated_props = self.paginate.paginate(props_dicts, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=props_dicts),
                 ttl=300,
             )
-            return paginated_props
+            return props_dicts
 
         return await breaker.call(handler)
 
@@ -273,15 +275,18 @@ class PropertyService:
             print(f"Cached:::{cached}")
             if cached:
                 return self.mapper.many(items=cached, schema=PropertyOut)
-            props = await self.repo.get_all_by_user(user_id=user_id)
+            props = await self.repo.get_all_by_user(
+                user_id=user_id,
+                page=page,
+                per_page=per_page,
+            )
             props_dicts = self.mapper.many(items=props, schema=PropertyOut)
-            paginated_props = self.paginate.paginate(props_dicts, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=props_dicts),
                 ttl=300,
             )
-            return paginated_props
+            return props_dicts
 
         return await breaker.call(handler)
 
@@ -299,16 +304,20 @@ class PropertyService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return self.mapper.many(items=cached, schema=PropertyOut)
-            props = await self.repo.get_properties_by_lga_user(lga_id, user_id)
+            props = await self.repo.get_properties_by_lga_user(
+                lga_id,
+                user_id,
+                page=page,
+                per_page=per_page,
+            )
 
             props_dicts = self.mapper.many(items=props, schema=PropertyOut)
-            paginated_props = self.paginate.paginate(props_dicts, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_props),
+                self.paginate.get_list_json_dumps(paginated_props=props_dicts),
                 ttl=300,
             )
-            return paginated_props
+            return props_dicts
 
         return await breaker.call(handler)
 
@@ -119,15 +119,18 @@ class RentProofService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return cached
-            proofs = await self.repo.get_all_for_landlord(user_id)
+            proofs = await self.repo.get_all_for_landlord(
+                user_id,
+                page=page,
+                per_page=per_page,
+            )
             proofs_dicts = self.mapper.many(items=proofs, schema=RentProofOut)
-            paginated_files = self.paginate.paginate(proofs_dicts, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_files),
+                self.paginate.get_list_json_dumps(paginated_props=proofs_dicts),
                 ttl=300,
             )
-            return paginated_files
+            return proofs_dicts
 
         return await breaker.call(handler)
 
@@ -142,16 +145,18 @@ class RentProofService:
             if cached:
                 return cached
             proofs = await self.repo.get_all_for_property(
-                property_id=property_id, landlord_id=user_id
+                property_id=property_id,
+                landlord_id=user_id,
+                page=page,
+                per_page=per_page,
             )
             proofs_dicts = self.mapper.many(items=proofs, schema=RentProofOut)
-            paginated_files = self.paginate.paginate(proofs_dicts, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_files),
+                self.paginate.get_list_json_dumps(paginated_props=proofs_dicts),
                 ttl=300,
             )
-            return paginated_files
+            return proofs_dicts
 
         return await breaker.call(handler)
 
@@ -190,15 +195,14 @@ class RentProofService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return cached
-            files = await self.repo.get_all(user_id)
+            files = await self.repo.get_all(user_id, page=page, per_page=per_page)
             file_dicts = self.mapper.many(items=files, schema=RentProofOut)
-            paginated_files = self.paginate.paginate(file_dicts, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_props=paginated_files),
+                self.paginate.get_list_json_dumps(paginated_props=file_dicts),
                 ttl=300,
             )
-            return paginated_files
+            return file_dicts
 
         return await breaker.call(handler)
 
@@ -264,7 +268,7 @@ class RentProofService:
                     status_code=400, detail="Maximum of 3 files allowed."
                 )
 
-            file_hash = await self.compute.compute_file_hash(file_url=file_url)
+            file_hash = await self.compute.compute_file_hash_async(file_url=file_url)
             existing = await self.repo.get_by_hash(property_id, file_hash)
             if existing:
                 raise HTTPException(400, "This File has already been uploaded")
@@ -318,9 +322,9 @@ class RentProofService:
                     status_code=403,
                     detail="You cannot delete an file you didn't create",
                 )
-            token = await self.token_delete.generate_token(image_id=str(file.id))
+            token = self.token_delete.generate_token(image_id=str(file.id))
 
-            validated_token = await self.token_delete.validate_token(
+            validated_token = self.token_delete.validate_token(
                 image_id=str(file.id), token=token
             )
 
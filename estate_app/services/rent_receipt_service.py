@@ -82,7 +82,7 @@ class RentReceiptService:
 
         try:
             pdf_path = await run_in_thread(
-                ReceiptGenerator.generate_pdf,
+                ReceiptGenerator.write_pdf,
                 receipt,
             )
 
@@ -413,15 +413,16 @@ class RentReceiptService:
             receipts = await self.repo.get_tenant_receipts_for_property(
                 tenant_id=tenant.id,
                 property_id=property_id,
+                page=page,
+                per_page=per_page,
             )
             receipts_list = self.mapper.many(receipts, RentReceiptBaseOut)
-            paginated_receipts = self.paginate.paginate(receipts_list, page, per_page)
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_receipts),
+                self.paginate.get_list_json_dumps(receipts_list),
                 ttl=300,
             )
-            return paginated_receipts
+            return receipts_list
 
         return await breaker.call(handler)
 
@@ -443,16 +444,19 @@ class RentReceiptService:
             if cached:
                 return self.mapper.many(cached, RentReceiptBaseOut)
 
-            receipts = await self.repo.get_property_receipts(property_id)
+            receipts = await self.repo.get_property_receipts(
+                property_id,
+                page=page,
+                per_page=per_page,
+            )
             receipts_list = self.mapper.many(receipts, RentReceiptBaseOut)
-            paginated_receipts = self.paginate.paginate(receipts_list, page, per_page)
 
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_receipts),
+                self.paginate.get_list_json_dumps(receipts_list),
                 ttl=300,
             )
-            return paginated_receipts
+            return receipts_list
 
         return await breaker.call(handler)
 
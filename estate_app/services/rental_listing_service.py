@@ -58,16 +58,15 @@ class RentalListingService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return self.mapper.many(items=cached, schema=RentalListingOut)
-            listings = await self.repo.get_all()
+            listings = await self.repo.get_all(page=page, per_page=per_page)
             listings_out = self.mapper.many(items=listings, schema=RentalListingOut)
-            paginated = self.paginate.paginate(listings_out, page, per_page)
 
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -272,14 +271,12 @@ class RentalListingService:
 
             listings_out = self.mapper.many(listings, RentalListingOut)
 
-            paginated = self.paginate.paginate(listings_out, page, per_page)
-
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -301,14 +298,12 @@ class RentalListingService:
 
             listings_out = self.mapper.many(listings, RentalListingOut)
 
-            paginated = self.paginate.paginate(listings_out, page, per_page)
-
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -61,16 +61,15 @@ class SaleListingService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return self.mapper.many(items=cached, schema=SalesListingOut)
-            listings = await self.repo.get_all()
+            listings = await self.repo.get_all(page=page, per_page=per_page)
             listings_out = self.mapper.many(items=listings, schema=SalesListingOut)
-            paginated = self.paginate.paginate(listings_out, page, per_page)
 
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -87,16 +86,19 @@ class SaleListingService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return self.mapper.many(items=cached, schema=SalesListingOut)
-            listings = await self.repo.get_sold_properties(user_id=user_id)
+            listings = await self.repo.get_sold_properties(
+                user_id=user_id,
+                page=page,
+                per_page=per_page,
+            )
             listings_out = self.mapper.many(items=listings, schema=SalesListingOut)
-            paginated = self.paginate.paginate(listings_out, page, per_page)
 
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -306,14 +308,12 @@ class SaleListingService:
             if not listings:
                 return []
 
-            paginated = self.paginate.paginate(listings_out, page, per_page)
-
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -334,14 +334,12 @@ class SaleListingService:
 
             listings_out = self.mapper.many(listings, SalesListingOut)
 
-            paginated = self.paginate.paginate(listings_out, page, per_page)
-
             await cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated),
+                self.paginate.get_list_json_dumps(listings_out),
                 ttl=300,
             )
-            return paginated
+            return listings_out
 
         return await breaker.call(handler)
 
@@ -63,16 +63,15 @@ class SaleListingImageService:
         cached = await cache.get_json(cache_key)
         if cached:
             return self.mapper.many(items=cached, schema=BaseImageOut)
-        images = await self.repo.get_all(listing_id)
+        images = await self.repo.get_all(listing_id, page=page, per_page=per_page)
         images_out = self.mapper.many(items=images, schema=BaseImageOut)
-        paginated_images = self.paginate.paginate(images_out, page, per_page)
         await cache.set_json(
             cache_key,
-            self.paginate.get_list_json_dumps(paginated_images),
+            self.paginate.get_list_json_dumps(images_out),
             ttl=300,
         )
 
-        return paginated_images
+        return images_out
 
     async def get_image(self, current_user, listing_id: uuid.UUID, image_id: uuid.UUID):
         await self.permission.check_authenticated(current_user=current_user)
@@ -107,7 +106,7 @@ class SaleListingImageService:
                 raise HTTPException(
                     status_code=400, detail="Maximum of 5 images allowed per listing."
                 )
-            image_hash = await self.compute.compute_file_hash(image_url)
+            image_hash = await self.compute.compute_file_hash_async(image_url)
             print(f"Image_hash::{image_hash}")
             existing = await self.repo.get_by_hash(listing_id, image_hash)
             if existing:
@@ -180,7 +179,7 @@ class SaleListingImageService:
                     detail="You cannot update an image you didn't create",
                 )
 
-            new_hash = await self.compute.compute_file_hash(secure_url)
+            new_hash = await self.compute.compute_file_hash_async(secure_url)
             existing = await self.repo.get_by_hash(old_image.listing_id, new_hash)
             if existing and existing.id != image_id:
                 raise HTTPException(
@@ -221,9 +220,9 @@ class SaleListingImageService:
                     status_code=403,
                     detail="You cannot delete an image you didn't create",
                 )
-            token = await self.token_delete.generate_token(image_id=str(image.id))
+            token = self.token_delete.generate_token(image_id=str(image.id))
 
-            validated_token = await self.token_delete.validate_token(
+            validated_token = self.token_delete.validate_token(
                 image_id=str(image.id), token=token
             )
 
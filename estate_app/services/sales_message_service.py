@@ -163,15 +163,16 @@ class SalesMessagingService:
             messages = await self.messages.list_for_conversation_for_user(
                 conversation_id,
                 current_user.id,
+                page=page,
+                per_page=per_page,
             )
             message_dicts = self.mapper.many(items=messages, schema=MessageOut)
-            paginated_files = self.paginate.paginate(message_dicts, page, per_page)
             await self.cache.set_json(
                 cache_key,
-                self.paginate.get_list_json_dumps(paginated_files),
+                self.paginate.get_list_json_dumps(message_dicts),
                 ttl=300,
             )
-            return paginated_files
+            return message_dicts
 
         return await self.breaker.call(handler)
 
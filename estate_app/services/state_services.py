@@ -33,7 +33,7 @@ class StateService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return cached
-            states = await self.repo.get_all()
+            states = await self.repo.get_all(page=page, per_page=per_page)
 
             state_dicts = [
                 StateSchema(
@@ -51,9 +51,8 @@ class StateService:
             ]
             if not state_dicts:
                 return []
-            paginated_states = self.paginate.paginate(state_dicts, page, per_page)
-            await cache.set_json(cache_key, paginated_states, ttl=300)
-            return paginated_states
+            await cache.set_json(cache_key, state_dicts, ttl=300)
+            return state_dicts
 
         return await breaker.call(handler)
 
@@ -85,10 +84,9 @@ class StateService:
             if cached:
                 return cached
 
-            states = await self.repo.get_all_with_lgas()
-            paginated_states = self.paginate.paginate(states, page, per_page)
-            await cache.set_json(cache_key, paginated_states, ttl=300)
-            return paginated_states
+            states = await self.repo.get_all_with_lgas(page=page, per_page=per_page)
+            await cache.set_json(cache_key, states, ttl=300)
+            return states
 
         return await breaker.call(handler)
 
@@ -98,11 +96,10 @@ class StateService:
             cached = await cache.get_json(cache_key)
             if cached:
                 return cached
-            states = await self.repo.get_all_states()
+            states = await self.repo.get_all_states(page=page, per_page=per_page)
             state_dicts = [s.as_dict() for s in states]
-            paginated_states = self.paginate.paginate(state_dicts, page, per_page)
-            await cache.set_json(cache_key, paginated_states, ttl=300)
-            return paginated_states
+            await cache.set_json(cache_key, state_dicts, ttl=300)
+            return state_dicts
 
         return await breaker.call(handler)
 
@@ -319,17 +319,19 @@ class TenantService:
         if cached:
             return cached
 
-        tenants = await self.repo.get_all_by_property(property_id)
+        tenants = await self.repo.get_all_by_property(
+            property_id,
+            offset=(page - 1) * per_page,
+            limit=per_page,
+        )
         tenant_dicts = [
             TenantWithPropertyOut.model_validate(t).model_dump(mode="json")
             for t in tenants
         ]
 
-        paginated = self.paginate.paginate(tenant_dicts, page, per_page)
-
-        await cache.set_json(cache_key, paginated, ttl=300)
+        await cache.set_json(cache_key, tenant_dicts, ttl=300)
 
-        return paginated
+        return tenant_dicts
 
     async def admin_list_all_tenants(
         self, current_user, offset: int = 0, limit: int = 100